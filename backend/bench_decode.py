@@ -0,0 +1,80 @@
+"""Compare the old temp-file upload path against the in-memory decode path.
+
+Run from the backend directory:
+    python bench_decode.py path/to/images --iterations 20
+
+The "disk" path reproduces what /predict used to do (save to temp.jpg, read it
+back with cv2.imread, delete it). The "memory" path is the current one
+(np.frombuffer + cv2.imdecode). Both are timed with and without the MediaPipe
+step so the decode cost can be seen on its own.
+"""
+import argparse
+import glob
+import io
+import os
+import time
+
+import cv2
+
+from app import decode_image, extract_keypoints
+
+IMAGE_EXTENSIONS = ('*.jpg', '*.jpeg', '*.png')
+
+
+def load_payloads(image_dir):
+    paths = []
+    for pattern in IMAGE_EXTENSIONS:
+        paths.extend(glob.glob(os.path.join(image_dir, pattern)))
+    payloads = []
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            payloads.append(f.read())
+    return payloads
+
+
+def disk_decode(payload):
+    img_path = "temp.jpg"
+    with open(img_path, 'wb') as f:
+        f.write(payload)
+    img = cv2.imread(img_path)
+    os.remove(img_path)
+    return img
+
+
+def memory_decode(payload):
+    return decode_image(io.BytesIO(payload))
+
+
+def run(decode, payloads, iterations, with_landmarks):
+    start = time.perf_counter()
+    count = 0
+    for _ in range(iterations):
+        for payload in payloads:
+            img = decode(payload)
+            if with_landmarks and img is not None:
+                extract_keypoints(img)
+            count += 1
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('image_dir', help='Directory of sample pose images')
+    parser.add_argument('--iterations', type=int, default=20, help='Passes over the image set')
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.image_dir)
+    if not payloads:
+        raise SystemExit(f"No images found in {args.image_dir}")
+
+    print(f"{len(payloads)} images x {args.iterations} iterations")
+    for with_landmarks in (False, True):
+        label = "decode + landmarks" if with_landmarks else "decode only"
+        before = run(disk_decode, payloads, args.iterations, with_landmarks)
+        after = run(memory_decode, payloads, args.iterations, with_landmarks)
+        print(f"{label:>20}: disk {before:8.1f} req/s | memory {after:8.1f} req/s | x{after / before:.2f}")
+
+
+if __name__ == '__main__':
+    main()
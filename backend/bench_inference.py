@@ -0,0 +1,51 @@
+"""Latency of the pose classifier per engine across batch sizes 1-256.
+
+Run from the backend directory:
+    python bench_inference.py --repeats 200
+"""
+import argparse
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from pose_core import NumpyClassifier
+
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+
+
+def median_latency(fn, batch, repeats):
+    fn(batch)  # warm-up / tracing
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(batch)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='yoga_pose_model.h5')
+    parser.add_argument('--repeats', type=int, default=100)
+    args = parser.parse_args()
+
+    model = tf.keras.models.load_model(args.model, compile=False)
+    engine = NumpyClassifier.from_keras(model)
+    engines = {
+        'keras.predict': lambda x: model.predict(x, verbose=0),
+        'keras.__call__': lambda x: model(x, training=False).numpy(),
+        'tf.function': engine.as_tf_function(),
+        'numpy': engine.predict,
+    }
+
+    rng = np.random.default_rng(0)
+    print(f"{'batch':>6} " + ' '.join(f"{name:>16}" for name in engines) + "   (median ms per call)")
+    for batch_size in BATCH_SIZES:
+        batch = rng.random((batch_size, engine.input_dim), dtype=np.float32)
+        row = [median_latency(fn, batch, args.repeats) * 1000 for fn in engines.values()]
+        print(f"{batch_size:>6} " + ' '.join(f"{ms:>16.3f}" for ms in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Accuracy versus latency of landmark extraction across input sizes.
+
+Run from the backend directory against a labelled image folder laid out like
+the training set (one sub-folder per pose class):
+    python bench_input_size.py yoga_dataset/test --sizes 0 1280 960 640 480 320
+
+For each max side (0 = full resolution) it reports the time spent in
+downscale + colour conversion + MediaPipe, the detection rate, top-1 accuracy
+against the folder labels, agreement with the full-resolution prediction and
+the mean landmark shift relative to full resolution.
+"""
+import argparse
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+from mediapipe.python.solutions import pose as mp_pose
+
+from app import pipeline
+from pose_core import PosePipeline, normalize_pose_name
+
+IMAGE_EXTENSIONS = ('*.jpg', '*.jpeg', '*.png')
+
+
+def load_labelled_images(data_dir, limit):
+    class_index = {name: i for i, name in enumerate(pipeline.class_names)}
+    samples = []
+    for class_dir in sorted(os.listdir(data_dir)):
+        label = class_index.get(normalize_pose_name(class_dir))
+        if label is None:
+            continue
+        paths = []
+        for pattern in IMAGE_EXTENSIONS:
+            paths.extend(glob.glob(os.path.join(data_dir, class_dir, pattern)))
+        for path in sorted(paths)[:limit]:
+            img = cv2.imread(path)
+            if img is not None:
+                samples.append((img, label))
+    return samples
+
+
+def extract_all(samples, max_side):
+    keypoints = []
+    timings = []
+    with mp_pose.Pose(static_image_mode=True) as pose:
+        sized = PosePipeline(detector=pose.process, max_side=max_side)
+        for img, _ in samples:
+            start = time.perf_counter()
+            keypoints.append(sized.extract(img))
+            timings.append(time.perf_counter() - start)
+    return keypoints, np.array(timings)
+
+
+def classify(keypoints):
+    predictions = np.full(len(keypoints), -1)
+    detected = [i for i, kp in enumerate(keypoints) if kp is not None]
+    if detected:
+        predictions[detected] = pipeline.predict(np.stack([keypoints[i] for i in detected])).argmax(axis=1)
+    return predictions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('data_dir', help='Folder with one sub-folder of images per pose class')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 1280, 960, 640, 480, 320, 256])
+    parser.add_argument('--per-class', type=int, default=20, help='Images per class to use')
+    args = parser.parse_args()
+
+    samples = load_labelled_images(args.data_dir, args.per_class)
+    if not samples:
+        raise SystemExit(f"No labelled images found in {args.data_dir}")
+    labels = np.array([label for _, label in samples])
+    print(f"{len(samples)} images")
+
+    reference, _ = extract_all(samples, 0)
+    reference_pred = classify(reference)
+
+    print(f"{'max side':>9} {'ms p50':>8} {'ms p95':>8} {'detect':>7} {'top-1':>7} {'agree':>7} {'lm shift':>9}")
+    for max_side in args.sizes:
+        keypoints, timings = extract_all(samples, max_side)
+        predictions = classify(keypoints)
+        detected = predictions >= 0
+        both = [i for i, kp in enumerate(keypoints) if kp is not None and reference[i] is not None]
+        shift = np.mean([np.abs(keypoints[i].reshape(-1, 4)[:, :2] - reference[i].reshape(-1, 4)[:, :2]).mean()
+                         for i in both]) if both else float('nan')
+        print(f"{max_side or 'full':>9} {np.median(timings) * 1000:>8.1f} {np.percentile(timings, 95) * 1000:>8.1f} "
+              f"{detected.mean():>7.1%} {(predictions == labels).mean():>7.1%} "
+              f"{(predictions == reference_pred).mean():>7.1%} {shift:>9.4f}")
+
+
+if __name__ == '__main__':
+    main()
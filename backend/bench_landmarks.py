@@ -0,0 +1,79 @@
+"""Microbenchmark of the MediaPipe landmark -> feature vector conversion alone.
+
+Run from the backend directory:
+    python bench_landmarks.py --iterations 20000
+
+Builds a real NormalizedLandmarkList protobuf (33 landmarks, as returned in
+``results.pose_landmarks``) so attribute access costs what it does in
+production, then times the old per-landmark ``list.extend`` + ``np.array``
+loop against pose_core.landmarks: a fresh float32 vector, a preallocated
+buffer, and rows of a batch matrix.
+"""
+import argparse
+import time
+
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+from pose_core.landmarks import NUM_FEATURES, NUM_LANDMARKS, keypoints_matrix, landmarks_to_array
+
+
+class Results:
+    """Stand-in for the object ``Pose.process`` returns; only pose_landmarks is read"""
+
+    def __init__(self, pose_landmarks):
+        self.pose_landmarks = pose_landmarks
+
+
+def make_landmark_list(rng):
+    landmark_list = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z, visibility in rng.random((NUM_LANDMARKS, 4)):
+        landmark_list.landmark.add(x=x, y=y, z=z - 0.5, visibility=visibility)
+    return landmark_list
+
+
+def old_loop(landmarks):
+    keypoints = []
+    for lm in landmarks:
+        keypoints.extend([lm.x, lm.y, lm.z, lm.visibility])
+    return np.array(keypoints)
+
+
+def time_per_call(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=32, help='Results per keypoints_matrix call')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    landmark_list = make_landmark_list(rng)
+    landmarks = landmark_list.landmark
+    np.testing.assert_allclose(landmarks_to_array(landmarks), old_loop(landmarks), rtol=1e-6)
+
+    buffer = np.empty(NUM_FEATURES, dtype=np.float32)
+    batch = [Results(make_landmark_list(rng)) for _ in range(args.batch)]
+    batch_iterations = max(1, args.iterations // args.batch)
+
+    cases = [
+        ('list.extend + np.array (old)', lambda: old_loop(landmarks), args.iterations, 1),
+        ('landmarks_to_array', lambda: landmarks_to_array(landmarks), args.iterations, 1),
+        ('landmarks_to_array(out=buffer)', lambda: landmarks_to_array(landmarks, buffer), args.iterations, 1),
+        (f'keypoints_matrix (batch {args.batch})', lambda: keypoints_matrix(batch), batch_iterations, args.batch),
+    ]
+    baseline = None
+    for label, fn, iterations, per_call in cases:
+        us = time_per_call(fn, iterations) / per_call
+        baseline = baseline or us
+        print(f"{label:>34}: {us:7.2f} us/pose  x{baseline / us:.2f}")
+
+
+if __name__ == '__main__':
+    main()
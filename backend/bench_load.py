@@ -0,0 +1,374 @@
+"""Load test for the inference API: latency percentiles, throughput and errors.
+
+Run from the backend directory against a folder of pose images, either on a
+server you started yourself or on one this script starts locally:
+    python bench_load.py fixtures/ --url http://127.0.0.1:5000 --concurrency 1 4 16
+    python bench_load.py fixtures/ --start-server gunicorn --scenarios predict batch keypoints stream
+    python bench_load.py fixtures/ --output after.json --compare before.json
+
+Every worker runs a closed loop (send, wait for the answer, send again) on a
+keep-alive connection. Scenarios:
+    predict          POST /predict, one multipart image per request
+    predict_compact  POST /predict?compact=1 (no feedback in the body)
+    batch            POST /predict/batch with --batch-size images per request
+    keypoints        POST /predict/keypoints with packed float32 landmarks
+    detect           POST /detect with a base64 JSON image
+    stream           WebSocket /stream?echo=1; frames are pushed at --fps per
+                     connection and the latency is frame sent to its result
+                     received (decode, MediaPipe and classifier included);
+                     throughput is answered frames per second, and frames the
+                     server dropped while busy are reported as frames_dropped
+
+Only the standard library and simple-websocket (a flask-sock dependency) are
+used, so it runs offline. The JSON output records the git commit, settings and
+per scenario/concurrency results so runs can be compared across commits.
+"""
+import argparse
+import base64
+import datetime
+import glob
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+IMAGE_EXTENSIONS = ('*.jpg', '*.jpeg', '*.png')
+SCENARIOS = ('predict', 'predict_compact', 'batch', 'keypoints', 'detect', 'stream')
+NUM_FEATURES = 132
+CONTENT_TYPES = {'.png': 'image/png'}
+
+
+def load_images(image_dir):
+    paths = []
+    for pattern in IMAGE_EXTENSIONS:
+        paths.extend(glob.glob(os.path.join(image_dir, '**', pattern), recursive=True))
+    images = []
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            images.append((os.path.basename(path), f.read()))
+    return images
+
+
+def multipart(files):
+    """Encode [(field, filename, bytes)] as multipart/form-data; returns (body, content type)"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for field, filename, data in files:
+        content_type = CONTENT_TYPES.get(os.path.splitext(filename)[1].lower(), 'image/jpeg')
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + data + b'\r\n')
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def build_requests(scenario, images, batch_size, seed):
+    """Pre-encode every request body so the client spends no time on it during the run"""
+    if scenario in ('predict', 'predict_compact'):
+        path = '/predict?compact=1' if scenario == 'predict_compact' else '/predict'
+        return [(path, *multipart([('image', name, data)])) for name, data in images]
+    if scenario == 'batch':
+        requests = []
+        for start in range(0, len(images), batch_size):
+            chunk = images[start:start + batch_size]
+            requests.append(('/predict/batch', *multipart([('images', name, data) for name, data in chunk])))
+        return requests
+    if scenario == 'keypoints':
+        rng = np.random.default_rng(seed)
+        vectors = rng.uniform(0.05, 0.95, size=(len(images), NUM_FEATURES)).astype('<f4')
+        return [('/predict/keypoints', vector.tobytes(), 'application/octet-stream') for vector in vectors]
+    if scenario == 'detect':
+        return [('/detect', json.dumps({'image': 'data:image/jpeg;base64,' + base64.b64encode(data).decode()}).encode(),
+                 'application/json') for _, data in images]
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def summarize(latencies, errors, elapsed, items=0):
+    """Latency percentiles and error counts; throughput counts ``items`` (stream frames) when given"""
+    latencies = np.asarray(latencies) * 1000
+    completed = len(latencies)
+    total = completed + sum(errors.values())
+    summary = {
+        'requests': total,
+        'completed': completed,
+        'errors': dict(errors),
+        'error_rate': round(sum(errors.values()) / total, 4) if total else 0.0,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round((items or completed) / elapsed, 2) if elapsed else 0.0,
+    }
+    if completed:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary.update({
+            'mean_ms': round(float(latencies.mean()), 2),
+            'p50_ms': round(float(p50), 2),
+            'p95_ms': round(float(p95), 2),
+            'p99_ms': round(float(p99), 2),
+            'max_ms': round(float(latencies.max()), 2),
+        })
+    return summary
+
+
+def run_http(url, requests, concurrency, total, warmup, timeout):
+    """Closed-loop load over keep-alive connections; returns the summary dict"""
+    target = urlsplit(url)
+    lock = threading.Lock()
+    issued = [0]
+    latencies, errors = [], {}
+
+    def take():
+        with lock:
+            if issued[0] >= total + warmup:
+                return None
+            issued[0] += 1
+            return issued[0]
+
+    def worker():
+        conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=timeout)
+        try:
+            while True:
+                n = take()
+                if n is None:
+                    return
+                path, body, content_type = requests[n % len(requests)]
+                start = time.perf_counter()
+                try:
+                    conn.request('POST', path, body=body, headers={'Content-Type': content_type})
+                    response = conn.getresponse()
+                    response.read()
+                    outcome = None if response.status == 200 else f'http_{response.status}'
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    outcome = type(e).__name__
+                elapsed = time.perf_counter() - start
+                if n <= warmup:
+                    continue
+                with lock:
+                    if outcome is None:
+                        latencies.append(elapsed)
+                    else:
+                        errors[outcome] = errors.get(outcome, 0) + 1
+        finally:
+            conn.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def run_stream(url, frames, concurrency, duration, fps, timeout):
+    """One WebSocket per worker pushing frames at ``fps``; latency is frame sent to its result received.
+
+    The socket is opened with ``?echo=1`` so the server answers every frame it
+    processes, tagged with the frame's sequence number, instead of only pose
+    changes. Frames replaced by a newer one while the server was busy get no
+    answer and are counted as dropped.
+    """
+    from simple_websocket import Client, ConnectionClosed
+
+    ws_url = 'ws' + url[len('http'):] + '/stream?echo=1'
+    lock = threading.Lock()
+    latencies, errors = [], {}
+    sent = [0]
+
+    def record_error(name):
+        with lock:
+            errors[name] = errors.get(name, 0) + 1
+
+    def worker():
+        try:
+            ws = Client.connect(ws_url)
+        except Exception as e:
+            record_error(type(e).__name__)
+            return
+        frame_interval = 1.0 / fps
+        deadline = time.perf_counter() + duration
+        next_frame = time.perf_counter()
+        count = 0
+        # Send times of unanswered frames; the server numbers frames per connection from 1
+        pending = {}
+        try:
+            while True:
+                now = time.perf_counter()
+                sending = now < deadline
+                if sending and now >= next_frame:
+                    count += 1
+                    pending[count] = now
+                    ws.send(frames[(count - 1) % len(frames)])
+                    next_frame += frame_interval
+                    continue
+                # After the run, wait up to --timeout for the results still in flight
+                if not sending and (not pending or now >= deadline + timeout):
+                    break
+                message = ws.receive(timeout=max(0.0, (next_frame if sending else deadline + timeout) - now))
+                if message is None:
+                    continue
+                received = time.perf_counter()
+                reply = json.loads(message)
+                if 'frame' not in reply:
+                    continue
+                start = pending.pop(reply['frame'], None)
+                # Older unanswered frames were dropped in favour of this one
+                for seq in [seq for seq in pending if seq < reply['frame']]:
+                    del pending[seq]
+                if 'error' in reply and not reply.get('pose_lost'):
+                    record_error(reply['error'])
+                elif start is not None:
+                    with lock:
+                        latencies.append(received - start)
+        except ConnectionClosed:
+            record_error('ConnectionClosed')
+        finally:
+            with lock:
+                sent[0] += count
+            ws.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    summary = summarize(latencies, errors, time.perf_counter() - start)
+    summary['frames_sent'] = sent[0]
+    summary['frames_dropped'] = max(0, sent[0] - summary['requests'])
+    return summary
+
+
+def wait_ready(url, timeout):
+    target = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=5)
+            conn.request('GET', '/ready')
+            if conn.getresponse().status == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.5)
+    raise SystemExit(f"Server at {url} did not become ready within {timeout}s")
+
+
+def start_server(kind, url):
+    """Start a local server from this directory; returns the process"""
+    target = urlsplit(url)
+    env = dict(os.environ, PROFIT_BIND=f'{target.hostname}:{target.port}')
+    if kind == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app']
+    else:
+        command = [sys.executable, '-m', 'flask', '--app', 'app', 'run', '--no-reload',
+                   '--host', target.hostname, '--port', str(target.port)]
+    return subprocess.Popen(command, cwd=os.path.dirname(os.path.abspath(__file__)), env=env)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def fetch_metrics(url):
+    """Server-side /metrics text, saved next to the client numbers for per-stage breakdowns"""
+    target = urlsplit(url)
+    try:
+        conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=5)
+        conn.request('GET', '/metrics')
+        response = conn.getresponse()
+        return response.read().decode() if response.status == 200 else None
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(r['scenario'], r['concurrency']): r for r in json.load(f)['results']}
+    print(f"\nvs {baseline_path}")
+    for r in results:
+        old = baseline.get((r['scenario'], r['concurrency']))
+        if old is None or 'p50_ms' not in r or 'p50_ms' not in old:
+            continue
+        deltas = ' '.join(f"{key} {(r[key] - old[key]) / old[key]:+.1%}" if old[key] else f"{key} n/a"
+                          for key in ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps'))
+        print(f"{r['scenario']:>16} c={r['concurrency']:<4} {deltas}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('image_dir', help='Directory of pose images used as request fixtures')
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--start-server', choices=('flask', 'gunicorn'),
+                        help='Start a local server on --url and stop it afterwards')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=['predict'])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=200, help='Measured requests per HTTP run')
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests before each HTTP run')
+    parser.add_argument('--batch-size', type=int, default=8, help='Images per /predict/batch request')
+    parser.add_argument('--duration', type=float, default=15.0, help='Seconds per stream run')
+    parser.add_argument('--fps', type=float, default=12.0, help='Frames per second per stream connection')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    parser.add_argument('--ready-timeout', type=float, default=120.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Earlier JSON output to print deltas against')
+    args = parser.parse_args()
+
+    images = load_images(args.image_dir)
+    if not images:
+        raise SystemExit(f"No images found in {args.image_dir}")
+    url = args.url.rstrip('/')
+
+    server = start_server(args.start_server, url) if args.start_server else None
+    try:
+        wait_ready(url, args.ready_timeout)
+        results = []
+        print(f"{len(images)} fixture images against {url}")
+        print(f"{'scenario':>16} {'conc':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                if scenario == 'stream':
+                    summary = run_stream(url, [data for _, data in images], concurrency,
+                                         args.duration, args.fps, args.timeout)
+                else:
+                    requests = build_requests(scenario, images, args.batch_size, args.seed)
+                    summary = run_http(url, requests, concurrency, args.requests, args.warmup, args.timeout)
+                results.append({'scenario': scenario, 'concurrency': concurrency, **summary})
+                print(f"{scenario:>16} {concurrency:>5} {summary['throughput_rps']:>8.1f} "
+                      f"{summary.get('p50_ms', float('nan')):>8.1f} {summary.get('p95_ms', float('nan')):>8.1f} "
+                      f"{summary.get('p99_ms', float('nan')):>8.1f} {summary['error_rate']:>7.1%}")
+        server_metrics = fetch_metrics(url)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    if args.output:
+        report = {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'url': url,
+            'server': args.start_server,
+            'fixtures': len(images),
+            'settings': {key: getattr(args, key) for key in
+                         ('requests', 'warmup', 'batch_size', 'duration', 'fps', 'timeout', 'seed')},
+            'results': results,
+            'server_metrics': server_metrics,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
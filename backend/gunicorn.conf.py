@@ -0,0 +1,33 @@
+# Production entry point: gunicorn -c gunicorn.conf.py app:app
+#
+# The master imports app.py in fast-start mode. For a NumPy weight pack (.npz
+# with PROFIT_INFERENCE_ENGINE=numpy) it also loads the labels, feedback and
+# classifier weights once (load_resources), and forked workers share those
+# pages copy-on-write. TensorFlow and ONNX Runtime are not fork-safe, so with
+# any other model or engine each worker loads its own copy after the fork.
+# Workers build their MediaPipe graphs and threads in post_fork; /ready
+# reports 503 until that warm-up inference has run.
+import os
+
+os.environ.setdefault('PROFIT_FAST_START', '1')
+
+bind = os.environ.get('PROFIT_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('PROFIT_WORKERS', '2'))
+worker_class = 'gthread'
+threads = int(os.environ.get('PROFIT_THREADS', '8'))
+preload_app = True
+timeout = 60
+
+
+def when_ready(server):
+    from app import fork_safe_model, load_resources, startup_timings
+    if not fork_safe_model():
+        server.log.info("Model is not a NumPy weight pack; each worker loads it after fork")
+        return
+    load_resources()
+    server.log.info(f"Preloaded in master: {startup_timings}")
+
+
+def post_fork(server, worker):
+    from app import start_warm_up
+    start_warm_up()
@@ -0,0 +1,19 @@
+"""Shared inference helpers for the PROFIT backend"""
+from .batching import MicroBatcher
+from .metrics import REGISTRY, MetricsRegistry
+from .engine import PRECISIONS, NumpyClassifier, build_predict_fn
+from .export import export_variants, variant_path
+from .onnx_backend import OnnxClassifier, export_onnx, onnx_path
+from .detector_pool import PoseDetectorPool, default_pool_size
+from .landmarks import NUM_FEATURES, NUM_LANDMARKS, keypoints_matrix, landmarks_to_array, pose_keypoints
+from .keypoint_cache import DATASET_POSE_SETTINGS, KeypointCache
+from .dataset import KeypointShards, make_dataset, stratified_split
+from .streaming import FrameStream
+from .sessions import PoseSession, SessionLimitError, SessionManager
+from .smoothing import LiveSmoother, OneEuroFilter, PredictionSmoother
+from .motion_gate import MotionGate
+from .preprocess import RoiTracker, downscale
+from .feedback import EncodedJson, FeedbackStore
+from .catalogue import PoseCatalogue
+from .labels import load_labels, normalize_pose_name
+from .pipeline import PosePipeline, normalize_keypoints
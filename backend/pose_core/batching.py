@@ -0,0 +1,121 @@
+"""Dynamic micro-batching for the pose classifier"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from .metrics import BATCH_SIZE_BUCKETS, REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _Pending:
+    __slots__ = ('vector', 'future', 'enqueued')
+
+    def __init__(self, vector):
+        self.vector = vector
+        self.future = Future()
+        self.enqueued = time.perf_counter()
+
+
+class MicroBatcher:
+    """Collect single keypoint vectors from concurrent requests into one forward pass.
+
+    ``predict_fn`` takes an ``(n, features)`` array and returns ``(n, classes)``
+    probabilities. The worker waits for the first request, then keeps pulling
+    until it has ``max_batch_size`` vectors or ``max_wait_ms`` has passed since
+    that first request arrived.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=5.0, name='classifier', registry=REGISTRY):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+        self.queue_depth = registry.gauge(
+            'profit_batcher_queue_depth', 'Vectors waiting for a classifier batch', ('batcher',))
+        self.batch_size = registry.histogram(
+            'profit_batcher_batch_size', 'Vectors per classifier forward pass', ('batcher',),
+            buckets=BATCH_SIZE_BUCKETS)
+        self.stage_latency = registry.histogram(
+            'profit_batcher_stage_seconds', 'Micro-batching latency by stage', ('batcher', 'stage'))
+
+    def start(self):
+        # Started lazily so the worker thread is created after a fork, not before
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f'{self.name}-batcher', daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout=None):
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, vector):
+        """Queue one feature vector and return a Future for its probability row"""
+        if self._thread is None:
+            self.start()
+        pending = _Pending(np.asarray(vector).reshape(-1))
+        self._queue.put(pending)
+        self.queue_depth.set(self._queue.qsize(), batcher=self.name)
+        return pending.future
+
+    def predict(self, vector, timeout=None):
+        return self.submit(vector).result(timeout)
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = first.enqueued + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = self._collect(first)
+            self.queue_depth.set(self._queue.qsize(), batcher=self.name)
+            self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        started = time.perf_counter()
+        for pending in batch:
+            self.stage_latency.observe(started - pending.enqueued, batcher=self.name, stage='queue_wait')
+        self.batch_size.observe(len(batch), batcher=self.name)
+
+        try:
+            probabilities = np.asarray(self.predict_fn(np.stack([p.vector for p in batch])))
+        except Exception as e:
+            logger.error(f"Batched prediction failed for {len(batch)} requests: {e}")
+            for pending in batch:
+                pending.future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        self.stage_latency.observe(finished - started, batcher=self.name, stage='forward')
+        for pending, row in zip(batch, probabilities):
+            pending.future.set_result(row)
+            self.stage_latency.observe(finished - pending.enqueued, batcher=self.name, stage='total')
@@ -0,0 +1,94 @@
+"""Indexed pose catalogue behind the /poses, /pose/<name> and /feedback routes"""
+from .feedback import EncodedJson
+
+UNKNOWN_DIFFICULTY = 'Unknown'
+# (minimum accuracy, message), checked from the top
+ACCURACY_TIERS = (
+    (85, 'Excellent form! Hold the pose and keep breathing steadily.'),
+    (70, 'Good form. Refine the alignment cues below to deepen the pose.'),
+    (50, 'Getting there. Focus on the alignment cues and avoid the common mistakes below.'),
+    (0, 'Keep practising. Ease into the pose and use a modification if needed.'),
+)
+# Below this accuracy the common mistakes are included in the feedback list
+MISTAKES_BELOW = 70
+
+
+def name_variants(name):
+    """Spellings of ``name`` the index answers to without normalizing per request"""
+    variants = set()
+    for alias in [name] + name.split(' Or '):
+        alias = alias.strip()
+        if not alias:
+            continue
+        for spelling in (alias, alias.replace(' ', '_'), alias.replace(' ', '-')):
+            variants.add(spelling)
+            variants.add(spelling.lower())
+    return variants
+
+
+class PoseCatalogue:
+    """Pose details keyed by canonical (normalized) class name.
+
+    Everything a catalogue route returns is built once at load time: a lookup
+    index of name spellings and aliases (the parts of "English Pose Or
+    Sanskrit" names, snake_case dataset folder names, lower case), and the
+    encoded listing and per-pose documents with their ETags.
+    """
+
+    def __init__(self, names, feedback_entries, aliases=()):
+        self.poses = {}
+        for name in names:
+            # "Viparita Virabhadrasana Or Reverse Warrior Pose" may be filed under either part
+            entry = feedback_entries.get(name) or next(
+                (feedback_entries[alias.strip()] for alias in name.split(' Or ') if alias.strip() in feedback_entries),
+                {})
+            self.poses[name] = {
+                'name': name,
+                'difficulty': entry.get('difficulty', UNKNOWN_DIFFICULTY),
+                'description': entry.get('description', ''),
+                'benefits': entry.get('benefits', []),
+                'feedback': entry.get('alignment_cues', []),
+                'common_mistakes': entry.get('common_mistakes', []),
+                'modifications': entry.get('modifications', ''),
+            }
+
+        self._index = {}
+        # Aliases first so a canonical spelling always wins a collision
+        for name, alias in zip(names, aliases):
+            for variant in name_variants(alias):
+                self._index[variant] = name
+        for name in names:
+            for variant in name_variants(name):
+                self._index[variant] = name
+
+        by_difficulty = {}
+        for pose in self.poses.values():
+            by_difficulty.setdefault(pose['difficulty'], []).append(
+                {'name': pose['name'], 'difficulty': pose['difficulty'], 'description': pose['description']})
+        self.listing = EncodedJson({'total_poses': len(self.poses), 'poses_by_difficulty': by_difficulty})
+        self._documents = {name: EncodedJson({'pose': pose}) for name, pose in self.poses.items()}
+
+    def __len__(self):
+        return len(self.poses)
+
+    def resolve(self, name):
+        """Canonical name for any indexed spelling of ``name``, or None"""
+        return self._index.get(name) or self._index.get(name.lower())
+
+    def get(self, name):
+        return self.poses.get(self.resolve(name))
+
+    def document(self, name):
+        """Encoded ``{"pose": ...}`` document for ``name``, or None if unknown"""
+        return self._documents.get(self.resolve(name))
+
+    def feedback_for(self, name, accuracy):
+        """Feedback list for a pose held at ``accuracy`` percent"""
+        pose = self.get(name)
+        if pose is None:
+            return None
+        message = next((text for threshold, text in ACCURACY_TIERS if accuracy >= threshold), ACCURACY_TIERS[-1][1])
+        feedback = [message] + pose['feedback']
+        if accuracy < MISTAKES_BELOW:
+            feedback += [f'Avoid: {mistake}' for mistake in pose['common_mistakes']]
+        return feedback
@@ -0,0 +1,91 @@
+"""Streaming tf.data input pipeline over cached keypoint shards"""
+import numpy as np
+
+from .landmarks import KEYPOINT_DTYPE, VALUES_PER_LANDMARK
+
+
+class KeypointShards:
+    """Row-addressable view over several ``(N_i, features)`` arrays.
+
+    Shards are typically read-only memmaps (the keypoint cache) plus small
+    in-memory blocks (synthetic data). Samples are referenced by a global row
+    number, so nothing is concatenated or copied up front.
+    """
+
+    def __init__(self, shards):
+        self.shards = [shard for shard in shards if shard is not None and len(shard)]
+        if not self.shards:
+            raise ValueError("At least one non-empty shard is required")
+        for shard in self.shards:
+            if shard.dtype != KEYPOINT_DTYPE:
+                raise TypeError(f"Keypoint shards must be float32, got {shard.dtype}")
+        self.num_features = self.shards[0].shape[1]
+        self.offsets = np.cumsum([0] + [len(shard) for shard in self.shards])
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def global_rows(self, shard_index, rows):
+        return np.asarray(rows, dtype=np.int64) + self.offsets[shard_index]
+
+    def gather(self, rows):
+        """Read the given global rows into one float32 batch, touching each shard once"""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.empty((len(rows), self.num_features), dtype=KEYPOINT_DTYPE)
+        shard_ids = np.searchsorted(self.offsets, rows, side='right') - 1
+        for shard_id in np.unique(shard_ids):
+            mask = shard_ids == shard_id
+            local = rows[mask] - self.offsets[shard_id]
+            # Sorted reads keep memmap access sequential
+            order = np.argsort(local, kind='stable')
+            block = self.shards[shard_id][local[order]]
+            positions = np.flatnonzero(mask)
+            out[positions[order]] = block
+        return out
+
+
+def stratified_split(labels, test_size=0.2, random_state=42):
+    """Split sample positions (not data) into stratified train/test index arrays"""
+    from sklearn.model_selection import train_test_split
+
+    positions = np.arange(len(labels))
+    return train_test_split(positions, test_size=test_size, random_state=random_state, stratify=labels)
+
+
+def make_dataset(shards, rows, labels, batch_size=32, training=False, shuffle_buffer=10000,
+                 augment_noise=0.0, seed=None):
+    """Build a ``tf.data.Dataset`` that yields ``(features, label)`` batches lazily.
+
+    Only the row numbers and labels live in memory; each batch is gathered from
+    the shards inside a parallel ``map``. In training mode rows are shuffled
+    through ``shuffle_buffer`` and, if ``augment_noise`` is set, Gaussian noise
+    is added in a second parallel ``map``. Only the visibility channel is
+    clipped back to [0, 1]; x/y may leave the frame and z is negative in
+    front of the hips, so those keep their noisy values.
+    """
+    import tensorflow as tf
+
+    rows = np.asarray(rows, dtype=np.int64)
+    labels = np.asarray(labels, dtype=np.int64)
+    num_features = shards.num_features
+
+    def gather(batch_rows, batch_labels):
+        features = tf.numpy_function(shards.gather, [batch_rows], tf.float32)
+        features.set_shape([None, num_features])
+        return features, batch_labels
+
+    # x, y, z, visibility per landmark: only visibility is bounded
+    bounded = tf.constant(np.arange(num_features) % VALUES_PER_LANDMARK == VALUES_PER_LANDMARK - 1)
+
+    def augment(features, batch_labels):
+        noisy = features + tf.random.normal(tf.shape(features), stddev=augment_noise)
+        return tf.where(bounded, tf.clip_by_value(noisy, 0.0, 1.0), noisy), batch_labels
+
+    ds = tf.data.Dataset.from_tensor_slices((rows, labels))
+    if training:
+        ds = ds.shuffle(min(shuffle_buffer, len(rows)), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size)
+    ds = ds.map(gather, num_parallel_calls=tf.data.AUTOTUNE)
+    if training and augment_noise > 0:
+        ds = ds.map(augment, num_parallel_calls=tf.data.AUTOTUNE)
+    return ds.prefetch(tf.data.AUTOTUNE)
@@ -0,0 +1,92 @@
+"""Bounded pool of MediaPipe Pose detectors for threaded servers"""
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from .metrics import REGISTRY
+
+
+def default_pool_size():
+    return os.cpu_count() or 1
+
+
+class PoseDetectorPool:
+    """Hands out MediaPipe ``Pose`` graphs so that each is only used by one thread at a time.
+
+    A MediaPipe graph is not re-entrant, so sharing one between request threads
+    either serializes them or corrupts results. Detectors are created lazily up
+    to ``size``; once all are checked out, callers block until one is returned.
+    """
+
+    def __init__(self, size=None, factory=None, name='pose', registry=REGISTRY, **pose_kwargs):
+        self.size = size or default_pool_size()
+        self.name = name
+        if factory is None:
+            def factory():
+                from mediapipe.python.solutions import pose as mp_pose
+                return mp_pose.Pose(**pose_kwargs)
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+        self.wait_seconds = registry.histogram(
+            'profit_pose_pool_wait_seconds', 'Time spent waiting to check out a pose detector', ('pool',))
+        self.in_use = registry.gauge(
+            'profit_pose_pool_in_use', 'Pose detectors currently checked out', ('pool',))
+        self.created = registry.gauge(
+            'profit_pose_pool_created', 'Pose detectors created so far', ('pool',))
+
+    def _acquire(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                self.created.set(self._created, pool=self.name)
+                grow = True
+            else:
+                grow = False
+        if grow:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                    self.created.set(self._created, pool=self.name)
+                raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No pose detector free after {timeout}s (pool size {self.size})")
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        start = time.perf_counter()
+        detector = self._acquire(timeout)
+        self.wait_seconds.observe(time.perf_counter() - start, pool=self.name)
+        self.in_use.inc(pool=self.name)
+        try:
+            yield detector
+        finally:
+            self.in_use.dec(pool=self.name)
+            self._idle.put(detector)
+
+    def process(self, rgb, timeout=None):
+        with self.checkout(timeout) as detector:
+            return detector.process(rgb)
+
+    def close(self):
+        while True:
+            try:
+                detector = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            detector.close()
+            with self._lock:
+                self._created -= 1
+        self.created.set(self._created, pool=self.name)
@@ -0,0 +1,197 @@
+"""Direct-call inference engines for the Dense/BatchNorm/Dropout pose classifier"""
+import numpy as np
+
+SUPPORTED_ACTIVATIONS = ('linear', 'relu', 'softmax')
+# Weight storage precisions for .npz packs; weights are expanded to float32 at load for BLAS matmuls
+PRECISIONS = ('float32', 'float16', 'int8')
+INT8_MAX = 127
+
+
+def _softmax(x):
+    x = x - x.max(axis=1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=1, keepdims=True)
+    return x
+
+
+def quantize_int8(weights):
+    """Symmetric per-output-column int8 quantization; returns (int8 weights, float32 column scales)"""
+    scale = np.abs(weights).max(axis=0) / INT8_MAX
+    scale[scale == 0] = 1.0
+    quantized = np.clip(np.rint(weights / scale), -INT8_MAX, INT8_MAX).astype(np.int8)
+    return quantized, scale.astype(np.float32)
+
+
+def _batchnorm_affine(layer):
+    """Return the (scale, shift) pair an inference-mode BatchNormalization applies"""
+    variance = layer.moving_variance.numpy().astype(np.float64)
+    mean = layer.moving_mean.numpy().astype(np.float64)
+    gamma = layer.gamma.numpy().astype(np.float64) if layer.gamma is not None else np.ones_like(mean)
+    beta = layer.beta.numpy().astype(np.float64) if layer.beta is not None else np.zeros_like(mean)
+    scale = gamma / np.sqrt(variance + layer.epsilon)
+    return scale, beta - mean * scale
+
+
+def fold_keras_layers(model):
+    """Flatten a Sequential classifier into a list of (weights, bias, activation).
+
+    Dropout is dropped (identity at inference). In ``create_model`` each
+    BatchNormalization sits after a ReLU, so it cannot be merged into the Dense
+    before it; instead its affine transform is pushed into the next Dense:
+    ``(x * s + t) @ W + b == x @ (s[:, None] * W) + (t @ W + b)``. A
+    BatchNormalization after a linear Dense is folded backwards instead.
+    """
+    layers = []
+    pending = None
+    for layer in model.layers:
+        kind = type(layer).__name__
+        if kind in ('InputLayer', 'Dropout'):
+            continue
+        if kind == 'BatchNormalization':
+            scale, shift = _batchnorm_affine(layer)
+            if layers and layers[-1][2] == 'linear' and pending is None:
+                weights, bias, activation = layers[-1]
+                layers[-1] = (weights * scale, bias * scale + shift, activation)
+            elif pending is None:
+                pending = (scale, shift)
+            else:
+                pending = (pending[0] * scale, pending[1] * scale + shift)
+            continue
+        if kind != 'Dense':
+            raise ValueError(f"Unsupported layer for folding: {kind}")
+
+        activation = layer.get_config()['activation']
+        if activation not in SUPPORTED_ACTIVATIONS:
+            raise ValueError(f"Unsupported activation: {activation}")
+        weights, bias = (w.astype(np.float64) for w in layer.get_weights())
+        if pending is not None:
+            scale, shift = pending
+            bias = shift @ weights + bias
+            weights = scale[:, None] * weights
+            pending = None
+        layers.append((weights, bias, activation))
+
+    if pending is not None:
+        # Trailing BatchNormalization with nothing to fold into: keep it as a diagonal layer
+        scale, shift = pending
+        layers.append((np.diag(scale), shift, 'linear'))
+    return [(w.astype(np.float32), b.astype(np.float32), act) for w, b, act in layers]
+
+
+class NumpyClassifier:
+    """Runs the folded classifier as a handful of float32 matmuls"""
+
+    def __init__(self, layers):
+        self.layers = [
+            (np.ascontiguousarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32), act)
+            for w, b, act in layers
+        ]
+        self.input_dim = self.layers[0][0].shape[0]
+        self.num_classes = self.layers[-1][0].shape[1]
+
+    @classmethod
+    def from_keras(cls, model):
+        return cls(fold_keras_layers(model))
+
+    @classmethod
+    def load(cls, path):
+        """Load from a Keras ``.h5`` model or a ``.npz`` weight pack written by ``save``"""
+        if path.endswith('.npz'):
+            with np.load(path) as pack:
+                count = int(pack['num_layers'])
+                activations = [str(a) for a in pack['activations']]
+                precision = str(pack['precision']) if 'precision' in pack else 'float32'
+                layers = []
+                for i in range(count):
+                    weights = pack[f'w{i}'].astype(np.float32)
+                    if precision == 'int8':
+                        weights *= pack[f's{i}']
+                    layers.append((weights, pack[f'b{i}'], activations[i]))
+                return cls(layers)
+
+        import tensorflow as tf
+        return cls.from_keras(tf.keras.models.load_model(path, compile=False))
+
+    def quantized(self, precision):
+        """Copy whose weights went through ``precision`` storage (what loading that pack would give)"""
+        if precision == 'float32':
+            return NumpyClassifier(self.layers)
+        if precision == 'float16':
+            return NumpyClassifier([(w.astype(np.float16), b, act) for w, b, act in self.layers])
+        if precision == 'int8':
+            layers = []
+            for weights, bias, act in self.layers:
+                quantized, scale = quantize_int8(weights)
+                layers.append((quantized.astype(np.float32) * scale, bias, act))
+            return NumpyClassifier(layers)
+        raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+
+    def save(self, path, precision='float32'):
+        """Write a ``.npz`` weight pack; float16 halves and int8 quarters the weight bytes.
+
+        Biases stay float32 in every precision. int8 packs store symmetric
+        per-output-column scales next to each weight matrix.
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+        arrays = {'num_layers': np.array(len(self.layers)),
+                  'activations': np.array([act for _, _, act in self.layers]),
+                  'precision': np.array(precision)}
+        for i, (weights, bias, _) in enumerate(self.layers):
+            if precision == 'int8':
+                arrays[f'w{i}'], arrays[f's{i}'] = quantize_int8(weights)
+            else:
+                arrays[f'w{i}'] = weights.astype(precision)
+            arrays[f'b{i}'] = bias
+        np.savez(path, **arrays)
+
+    def predict(self, batch):
+        x = np.asarray(batch, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        for weights, bias, activation in self.layers:
+            x = x @ weights
+            x += bias
+            if activation == 'relu':
+                np.maximum(x, 0, out=x)
+            elif activation == 'softmax':
+                x = _softmax(x)
+        return x
+
+    __call__ = predict
+
+    def as_tf_function(self):
+        """Build a traced ``tf.function`` over the folded weights (one graph for any batch size)"""
+        import tensorflow as tf
+
+        constants = [(tf.constant(w), tf.constant(b), act) for w, b, act in self.layers]
+
+        @tf.function(input_signature=[tf.TensorSpec([None, self.input_dim], tf.float32)])
+        def forward(x):
+            for weights, bias, activation in constants:
+                x = tf.matmul(x, weights) + bias
+                if activation == 'relu':
+                    x = tf.nn.relu(x)
+                elif activation == 'softmax':
+                    x = tf.nn.softmax(x)
+            return x
+
+        def predict(batch):
+            x = np.asarray(batch, dtype=np.float32)
+            if x.ndim == 1:
+                x = x.reshape(1, -1)
+            return forward(tf.convert_to_tensor(x)).numpy()
+
+        return predict
+
+
+def build_predict_fn(model, engine='numpy'):
+    """Return a ``batch -> probabilities`` callable for the requested engine"""
+    if engine == 'keras':
+        return lambda batch: model.predict(batch, verbose=0)
+    classifier = NumpyClassifier.from_keras(model)
+    if engine == 'tf_function':
+        return classifier.as_tf_function()
+    if engine == 'numpy':
+        return classifier.predict
+    raise ValueError(f"Unknown inference engine: {engine}")
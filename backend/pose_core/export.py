@@ -0,0 +1,99 @@
+"""Reduced-precision classifier variants, published only if they keep their accuracy"""
+import json
+import logging
+import os
+
+import numpy as np
+
+from .engine import PRECISIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ACCURACY_DROP = 0.01
+
+
+def variant_path(model_path, precision, extension='npz'):
+    """'yoga_pose_model.h5' -> 'yoga_pose_model.int8.npz' (or '.int8.onnx' with extension='onnx')"""
+    return f"{os.path.splitext(model_path)[0]}.{precision}.{extension}"
+
+
+def manifest_path(model_path):
+    return f"{os.path.splitext(model_path)[0]}.variants.json"
+
+
+def top1_accuracy(predict_fn, features, labels):
+    predictions = np.asarray(predict_fn(features)).argmax(axis=1)
+    return float((predictions == np.asarray(labels)).mean())
+
+
+def _publish(entry, name, accuracy, reference, max_accuracy_drop, write):
+    """Apply the accuracy gate to one variant: write it if it passes, remove any stale file if not"""
+    drop = reference - accuracy
+    entry.update(accuracy=accuracy, accuracy_drop=drop, published=drop <= max_accuracy_drop)
+    if entry['published']:
+        write(entry['path'])
+        entry['bytes'] = os.path.getsize(entry['path'])
+        logger.info(f"Published {name} variant {entry['path']}: top-1 {accuracy:.4f} "
+                    f"(drop {drop:+.4f}), {entry['bytes'] / 1024:.0f} KiB")
+    else:
+        if os.path.exists(entry['path']):
+            os.remove(entry['path'])
+        logger.warning(f"Refused {name} variant: top-1 {accuracy:.4f} is {drop:.4f} below float32 "
+                       f"(limit {max_accuracy_drop})")
+    return entry
+
+
+def _export_onnx_int8(classifier, features, labels, model_path, reference, max_accuracy_drop):
+    """Gate and write the dynamically quantized ONNX model; raises ImportError without onnx/onnxruntime"""
+    from .onnx_backend import OnnxClassifier, export_onnx_int8
+
+    path = variant_path(model_path, 'int8', 'onnx')
+    # The quantized graph is scored from a scratch file and only moved into place if it passes
+    scratch = f"{path}.tmp"
+    try:
+        export_onnx_int8(classifier, scratch)
+        accuracy = top1_accuracy(OnnxClassifier(scratch).predict, features, labels)
+        return _publish({'path': path}, 'int8 ONNX', accuracy, reference, max_accuracy_drop,
+                        lambda target: os.replace(scratch, target))
+    finally:
+        if os.path.exists(scratch):
+            os.remove(scratch)
+
+
+def export_variants(classifier, features, labels, model_path, precisions=PRECISIONS,
+                    max_accuracy_drop=DEFAULT_MAX_ACCURACY_DROP, onnx_int8=True):
+    """Write one ``.npz`` weight pack per precision next to ``model_path``, behind an accuracy gate.
+
+    ``classifier`` is the float32 ``NumpyClassifier`` of the trained model and
+    ``features``/``labels`` the held-out split. A variant whose top-1 accuracy
+    falls more than ``max_accuracy_drop`` (absolute) below float32 is not
+    written, and any stale file from an earlier export is removed, so the API
+    can never pick it up. The per-variant report is saved as
+    ``<model>.variants.json`` and returned.
+
+    The ``.npz`` packs only save disk: the numpy engine expands them to
+    float32 at load. With ``onnx_int8`` (and onnx/onnxruntime installed) a
+    dynamically quantized ``<model>.int8.onnx`` is gated the same way; the
+    onnx engine serves it with int8 weights and integer matmuls.
+    """
+    features = np.asarray(features, dtype=np.float32)
+    reference = top1_accuracy(classifier.predict, features, labels)
+    report = {'reference_accuracy': reference, 'max_accuracy_drop': max_accuracy_drop,
+              'held_out_samples': len(features), 'variants': {}}
+
+    for precision in precisions:
+        accuracy = top1_accuracy(classifier.quantized(precision).predict, features, labels)
+        report['variants'][precision] = _publish(
+            {'path': variant_path(model_path, precision)}, precision, accuracy, reference, max_accuracy_drop,
+            lambda path: classifier.save(path, precision))
+
+    if onnx_int8:
+        try:
+            report['variants']['int8_onnx'] = _export_onnx_int8(
+                classifier, features, labels, model_path, reference, max_accuracy_drop)
+        except ImportError:
+            logger.warning("onnx/onnxruntime not installed; skipping the int8 ONNX variant")
+
+    with open(manifest_path(model_path), 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
@@ -0,0 +1,35 @@
+"""Landmark extraction for dataset images, including the process-pool worker side.
+
+Kept free of TensorFlow: spawned extraction workers import this module (to
+unpickle the worker function), so it must only pull in MediaPipe and OpenCV.
+"""
+import logging
+
+from .keypoint_cache import DATASET_POSE_SETTINGS
+from .pipeline import PosePipeline
+
+logger = logging.getLogger(__name__)
+
+# One Pose graph per extraction worker process, created by the pool initializer
+_worker_pipeline = None
+
+
+def extract_keypoints_with(pipeline, image_path):
+    """Extract pose keypoints from an image file with the given PosePipeline"""
+    try:
+        return pipeline.extract_path(image_path)
+    except Exception as e:
+        logger.error(f"Error extracting keypoints from {image_path}: {e}")
+        return None
+
+
+def init_extraction_worker():
+    """Process pool initializer: build this worker's static-image Pose graph"""
+    from mediapipe.python.solutions import pose as mp_pose
+
+    global _worker_pipeline
+    _worker_pipeline = PosePipeline(detector=mp_pose.Pose(**DATASET_POSE_SETTINGS).process)
+
+
+def extract_keypoints_worker(image_path):
+    return extract_keypoints_with(_worker_pipeline, image_path)
@@ -0,0 +1,55 @@
+"""Pose feedback loaded once and kept pre-serialized for response splicing"""
+import gzip
+import hashlib
+import json
+
+EMPTY_FRAGMENT = '{}'
+
+
+class EncodedJson:
+    """One JSON document encoded once: compact text, UTF-8 body, gzip body and strong ETag"""
+
+    __slots__ = ('text', 'body', 'gzip', 'etag')
+
+    def __init__(self, document):
+        self.text = json.dumps(document, ensure_ascii=False, separators=(',', ':'))
+        self.body = self.text.encode('utf-8')
+        self.gzip = gzip.compress(self.body, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha1(self.body).hexdigest()[:20]
+
+
+class FeedbackStore:
+    """Feedback entries keyed by normalized pose name.
+
+    Each entry is serialized to compact JSON once at load time, so responses
+    splice the cached text in instead of re-encoding the description, cues,
+    benefits and mistakes on every request. ``encoded`` also gives the
+    standalone feedback route its precomputed gzip body and strong ETag.
+    """
+
+    def __init__(self, entries):
+        self.entries = dict(entries)
+        self._encoded = {name: EncodedJson(entry) for name, entry in self.entries.items()}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, name, default=None):
+        return self.entries.get(name, default)
+
+    def encoded(self, name):
+        """``EncodedJson`` for ``name``, or None for poses without feedback"""
+        return self._encoded.get(name)
+
+    def fragment(self, name):
+        """Serialized JSON for ``name`` (``{}`` for poses without feedback)"""
+        encoded = self._encoded.get(name)
+        return encoded.text if encoded is not None else EMPTY_FRAGMENT
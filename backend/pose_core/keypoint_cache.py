@@ -0,0 +1,157 @@
+"""Content-addressed on-disk cache of MediaPipe landmark vectors"""
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from .landmarks import KEYPOINT_DTYPE, NUM_FEATURES, check_keypoints
+
+logger = logging.getLogger(__name__)
+
+NO_POSE = -1
+DEFAULT_CACHE_DIR = os.path.join('processed_data', 'keypoint_cache')
+
+# MediaPipe settings used for dataset extraction (trainer, evaluation and batch tools)
+DATASET_POSE_SETTINGS = {
+    'static_image_mode': True,
+    'model_complexity': 1,
+    'enable_segmentation': False,
+    'min_detection_confidence': 0.7,
+    'min_tracking_confidence': 0.5
+}
+
+
+class KeypointCache:
+    """Landmark vectors keyed by a hash of the image bytes plus the detector settings.
+
+    ``cache_dir`` holds ``keypoints.npy`` (an ``(N, 132)`` float32 array opened
+    as a read-only memmap) and ``index.json`` mapping each key to its row.
+    Images without a detected pose are recorded too (row ``-1``) so they are
+    not re-processed either. New entries are buffered and appended by ``flush``.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, settings=None, num_features=NUM_FEATURES):
+        self.cache_dir = cache_dir
+        self.num_features = num_features
+        settings = DATASET_POSE_SETTINGS if settings is None else settings
+        self._settings_digest = hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).digest()
+        self._array_path = os.path.join(cache_dir, 'keypoints.npy')
+        self._index_path = os.path.join(cache_dir, 'index.json')
+        self._index = {}
+        self._rows = None
+        self._pending = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, 'r') as f:
+            index = json.load(f)
+        if index.get('num_features') != self.num_features:
+            logger.warning(f"Ignoring keypoint cache in {self.cache_dir}: feature count changed")
+            return
+        self._index = index['entries']
+        if os.path.exists(self._array_path):
+            self._rows = np.load(self._array_path, mmap_mode='r')
+
+    def __len__(self):
+        return len(self._index) + len(self._pending)
+
+    def key_for(self, image_path, chunk_size=1 << 20):
+        digest = hashlib.sha1(self._settings_digest)
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return ``(hit, keypoints)``; keypoints is None when no pose was detected"""
+        if key in self._pending:
+            return True, self._pending[key]
+        row = self._index.get(key)
+        if row is None:
+            return False, None
+        if row == NO_POSE:
+            return True, None
+        return True, np.array(self._rows[row])
+
+    def put(self, key, keypoints):
+        if keypoints is not None:
+            keypoints = check_keypoints(keypoints, f'keypoints for {key}').reshape(self.num_features)
+        self._pending[key] = keypoints
+
+    def flush(self):
+        """Append buffered entries to the array and rewrite the index atomically"""
+        if not self._pending:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        existing = 0 if self._rows is None else len(self._rows)
+        new_rows = [kp for kp in self._pending.values() if kp is not None]
+
+        if new_rows:
+            tmp_array = self._array_path + '.tmp.npy'
+            out = np.lib.format.open_memmap(
+                tmp_array, mode='w+', dtype=KEYPOINT_DTYPE, shape=(existing + len(new_rows), self.num_features))
+            if existing:
+                out[:existing] = self._rows
+            out[existing:] = np.stack(new_rows)
+            out.flush()
+            del out
+            self._rows = None
+            os.replace(tmp_array, self._array_path)
+
+        next_row = existing
+        for key, keypoints in self._pending.items():
+            if keypoints is None:
+                self._index[key] = NO_POSE
+            else:
+                self._index[key] = next_row
+                next_row += 1
+
+        tmp_index = self._index_path + '.tmp'
+        with open(tmp_index, 'w') as f:
+            json.dump({'num_features': self.num_features, 'entries': self._index}, f)
+        os.replace(tmp_index, self._index_path)
+
+        self._pending = {}
+        if os.path.exists(self._array_path):
+            self._rows = np.load(self._array_path, mmap_mode='r')
+
+    @property
+    def array(self):
+        """Read-only memmap over all flushed rows (None while the cache is empty)"""
+        return self._rows
+
+    def _fill(self, image_paths, extract_many, keep=True):
+        """Extract and cache every path not already present; return (keys, {position: keypoints})"""
+        keys = [self.key_for(path) for path in image_paths]
+        missing = [i for i, key in enumerate(keys) if key not in self._index and key not in self._pending]
+
+        logger.info(f"Keypoint cache: {len(image_paths) - len(missing)} hits, {len(missing)} to extract")
+        extracted = {}
+        if missing:
+            try:
+                results = extract_many([image_paths[i] for i in missing])
+                for i, keypoints in zip(missing, results):
+                    self.put(keys[i], keypoints)
+                    if keep:
+                        extracted[i] = keypoints
+            finally:
+                self.flush()
+        return keys, extracted
+
+    def resolve(self, image_paths, extract_many):
+        """Return keypoints for every path, running ``extract_many`` only on cache misses.
+
+        ``extract_many`` receives the list of missing paths and must yield one
+        result (array or None) per path, in order.
+        """
+        keys, extracted = self._fill(image_paths, extract_many)
+        return [extracted[i] if i in extracted else self.get(key)[1] for i, key in enumerate(keys)]
+
+    def resolve_rows(self, image_paths, extract_many):
+        """Like ``resolve`` but return row numbers into ``array`` (``-1`` for no pose) instead of copies"""
+        keys, _ = self._fill(image_paths, extract_many, keep=False)
+        return np.array([self._index[key] for key in keys], dtype=np.int64)
@@ -0,0 +1,18 @@
+"""Pose class names: dataset folder names to display names, and the labels file"""
+import json
+import re
+
+
+def normalize_pose_name(name):
+    """'Bow_Pose_or_Dhanurasana_' -> 'Bow Pose Or Dhanurasana'"""
+    # Replace underscores and hyphens with spaces, trim, then title case
+    name = re.sub(r'[_\-]+', ' ', name)
+    name = name.strip(" _-")
+    return name.title()
+
+
+def load_labels(path, normalize=True):
+    """Class names from a ``{"classes": [...]}`` labels file, in model output order"""
+    with open(path, 'r') as f:
+        classes = json.load(f)['classes']
+    return [normalize_pose_name(name) for name in classes] if normalize else list(classes)
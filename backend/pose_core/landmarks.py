@@ -0,0 +1,62 @@
+"""MediaPipe landmark lists to float32 feature vectors"""
+import numpy as np
+
+NUM_LANDMARKS = 33
+VALUES_PER_LANDMARK = 4  # x, y, z, visibility
+NUM_FEATURES = NUM_LANDMARKS * VALUES_PER_LANDMARK
+# Keypoints stay float32 from extraction through caches, training arrays and inference
+KEYPOINT_DTYPE = np.float32
+
+
+def check_keypoints(array, name='keypoints'):
+    """Return ``array`` if it is a float32 vector or matrix of NUM_FEATURES-wide rows, else raise.
+
+    Used where keypoints cross module boundaries so a float64 array is caught
+    where it enters instead of being silently up- or down-cast downstream.
+    """
+    dtype = getattr(array, 'dtype', None)
+    if dtype != KEYPOINT_DTYPE:
+        raise TypeError(f"{name} must be a float32 ndarray, got {dtype or type(array).__name__}")
+    if array.ndim not in (1, 2) or array.shape[-1] != NUM_FEATURES:
+        raise ValueError(f"{name} must have {NUM_FEATURES} values per pose, got shape {array.shape}")
+    return array
+
+
+def landmarks_to_array(landmarks, out=None):
+    """Pack landmarks as [x0, y0, z0, v0, x1, ...] into a float32 vector.
+
+    ``landmarks`` is ``results.pose_landmarks.landmark`` (or any sequence of
+    objects with x, y, z and visibility). ``out`` may be a preallocated
+    float32 vector, such as one row of a batch matrix; it is filled in place
+    and returned. The protobuf attribute reads dominate the cost, so the
+    values are gathered into one flat list and copied into the buffer in a
+    single conversion instead of building per-landmark lists.
+    """
+    if out is None:
+        out = np.empty(len(landmarks) * VALUES_PER_LANDMARK, dtype=KEYPOINT_DTYPE)
+    values = []
+    extend = values.extend
+    for lm in landmarks:
+        extend((lm.x, lm.y, lm.z, lm.visibility))
+    out[:] = values
+    return out
+
+
+def pose_keypoints(results, out=None):
+    """Feature vector for a MediaPipe ``Pose.process`` result, or None when no pose was found"""
+    if not results.pose_landmarks:
+        return None
+    return landmarks_to_array(results.pose_landmarks.landmark, out)
+
+
+def keypoints_matrix(results_list):
+    """Stack many ``Pose.process`` results into one (n, NUM_FEATURES) float32 matrix.
+
+    Rows without a pose are left as zeros; the second return value is a
+    boolean mask of the rows that were filled.
+    """
+    matrix = np.zeros((len(results_list), NUM_FEATURES), dtype=KEYPOINT_DTYPE)
+    found = np.zeros(len(results_list), dtype=bool)
+    for i, results in enumerate(results_list):
+        found[i] = pose_keypoints(results, matrix[i]) is not None
+    return matrix, found
@@ -0,0 +1,61 @@
+"""Cheap frame-difference gate in front of landmark extraction"""
+import cv2
+import numpy as np
+
+from .metrics import REGISTRY
+
+
+class MotionGate:
+    """Decides whether a live frame differs enough from the last processed one to be worth analysing.
+
+    Frames are reduced to a small grayscale thumbnail and compared by mean
+    absolute difference (0-255 scale) against the last frame that was let
+    through, so slow drift still accumulates into a refresh. After
+    ``max_skips`` consecutive skips a frame is always processed to keep
+    tracking and smoothing fed. ``threshold <= 0`` disables the gate.
+    Callers ``reset`` it when a processed frame had no pose, so an empty
+    scene is never skipped and a lost pose is reported without delay.
+
+    Given the session's ``smoother``, frames are only skipped once it has
+    settled: while a new pose is leading but not yet reported, the hysteresis
+    needs every frame, or the switch arrives ``max_skips`` frames late per step.
+    """
+
+    def __init__(self, threshold=3.0, size=(32, 24), max_skips=15, registry=REGISTRY):
+        self.threshold = threshold
+        self.size = size
+        self.max_skips = max_skips
+        self._reference = None
+        self._consecutive = 0
+        self.skipped = 0
+        self.processed = 0
+        self.frames = registry.counter(
+            'profit_motion_gate_frames_total', 'Live frames by motion gate decision', ('decision',))
+
+    def thumbnail(self, img):
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+        return cv2.resize(gray, self.size, interpolation=cv2.INTER_AREA).astype(np.int16)
+
+    def should_skip(self, img, smoother=None):
+        if self.threshold <= 0 or (smoother is not None and not smoother.settled):
+            self.processed += 1
+            return False
+
+        thumb = self.thumbnail(img)
+        if (self._reference is not None and self._consecutive < self.max_skips
+                and np.abs(thumb - self._reference).mean() < self.threshold):
+            self._consecutive += 1
+            self.skipped += 1
+            self.frames.inc(decision='skipped')
+            return True
+
+        self._reference = thumb
+        self._consecutive = 0
+        self.processed += 1
+        self.frames.inc(decision='processed')
+        return False
+
+    def reset(self):
+        """Forget the reference frame so the next frame is always processed"""
+        self._reference = None
+        self._consecutive = 0
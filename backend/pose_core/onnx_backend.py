@@ -0,0 +1,111 @@
+"""ONNX export of the folded classifier and an ONNX Runtime CPU inference backend"""
+import os
+import tempfile
+
+import numpy as np
+
+ONNX_OPSET = 13
+# IR version that introduced opset 13; pinned so older onnxruntime releases can still load the file
+ONNX_IR_VERSION = 7
+INPUT_NAME = 'keypoints'
+OUTPUT_NAME = 'probabilities'
+
+
+def onnx_path(model_path):
+    """'yoga_pose_model.h5' -> 'yoga_pose_model.onnx'"""
+    return f"{os.path.splitext(model_path)[0]}.onnx"
+
+
+def export_onnx(classifier, path, opset=ONNX_OPSET):
+    """Write a ``NumpyClassifier`` as an ONNX graph with a dynamic batch dimension.
+
+    The graph is built straight from the folded layers (MatMul, Add and
+    Relu/Softmax per Dense), so exporting needs the ``onnx`` package but
+    neither TensorFlow nor a converter; BatchNormalization and Dropout are
+    already folded away, so it matches ``NumpyClassifier.predict`` exactly.
+    """
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    nodes = []
+    initializers = []
+    current = INPUT_NAME
+    for i, (weights, bias, activation) in enumerate(classifier.layers):
+        initializers.append(numpy_helper.from_array(weights, f'w{i}'))
+        initializers.append(numpy_helper.from_array(bias, f'b{i}'))
+        nodes.append(helper.make_node('MatMul', [current, f'w{i}'], [f'matmul{i}']))
+        last = i == len(classifier.layers) - 1
+        dense_out = OUTPUT_NAME if last and activation == 'linear' else f'dense{i}'
+        nodes.append(helper.make_node('Add', [f'matmul{i}', f'b{i}'], [dense_out]))
+        current = dense_out
+        if activation == 'relu':
+            current = OUTPUT_NAME if last else f'relu{i}'
+            nodes.append(helper.make_node('Relu', [dense_out], [current]))
+        elif activation == 'softmax':
+            current = OUTPUT_NAME if last else f'softmax{i}'
+            nodes.append(helper.make_node('Softmax', [dense_out], [current], axis=-1))
+
+    graph = helper.make_graph(
+        nodes, 'pose_classifier',
+        [helper.make_tensor_value_info(INPUT_NAME, TensorProto.FLOAT, ['batch', classifier.input_dim])],
+        [helper.make_tensor_value_info(OUTPUT_NAME, TensorProto.FLOAT, ['batch', classifier.num_classes])],
+        initializers,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', opset)], producer_name='profit-app',
+                              ir_version=ONNX_IR_VERSION)
+    onnx.checker.check_model(model)
+    onnx.save(model, path)
+    return path
+
+
+def export_onnx_int8(classifier, path, opset=ONNX_OPSET):
+    """Write a dynamically quantized int8 ONNX graph of ``classifier``.
+
+    Weights are stored as int8 and each MatMul runs as ONNX Runtime's
+    ``MatMulInteger`` on activations quantized per batch, so the model stays
+    int8 in memory and uses integer kernels at serve time (unlike the int8
+    ``.npz`` pack, which is expanded to float32 when loaded).
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    with tempfile.TemporaryDirectory() as tmp:
+        float_path = export_onnx(classifier, os.path.join(tmp, 'float32.onnx'), opset)
+        quantize_dynamic(float_path, path, weight_type=QuantType.QInt8)
+    return path
+
+
+class OnnxClassifier:
+    """Batch predict function backed by an ONNX Runtime CPU session.
+
+    ``intra_op_threads`` bounds the threads one forward pass may use; with
+    several server workers on one host, 1 avoids oversubscribing the cores.
+    ``inter_op_threads`` only applies with ``parallel=True`` (ORT_PARALLEL),
+    which runs independent graph branches concurrently; the classifier is a
+    single chain, so sequential execution is the default. Loading imports
+    onnxruntime only, never TensorFlow.
+    """
+
+    def __init__(self, path, intra_op_threads=1, inter_op_threads=1, parallel=False):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        if parallel:
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+            options.inter_op_num_threads = inter_op_threads
+        else:
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(path, sess_options=options, providers=['CPUExecutionProvider'])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.output_name = self.session.get_outputs()[0].name
+        self.input_dim = model_input.shape[1]
+
+    def predict(self, batch):
+        x = np.ascontiguousarray(batch, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        return self.session.run([self.output_name], {self.input_name: x})[0]
+
+    __call__ = predict
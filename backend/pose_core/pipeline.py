@@ -0,0 +1,131 @@
+"""Decode -> landmarks -> normalize -> classify, shared by the API, trainer and tools"""
+from contextlib import nullcontext
+
+import cv2
+import numpy as np
+
+from .landmarks import KEYPOINT_DTYPE, NUM_FEATURES, check_keypoints, pose_keypoints
+from .preprocess import downscale
+
+
+def normalize_keypoints(vectors):
+    """Scale a pose vector, or each row of a (n, NUM_FEATURES) batch, to unit L2 norm"""
+    vectors = np.asarray(vectors, dtype=KEYPOINT_DTYPE)
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+class PosePipeline:
+    """The image-to-pose path with pluggable backends.
+
+    ``detector`` is any callable taking an RGB array and returning a MediaPipe
+    ``Pose.process`` result: a ``Pose`` graph's ``process``, a
+    ``PoseDetectorPool.process`` or a ``PoseSession.process``. ``classifier`` is
+    a batch predict function mapping a float32 (n, NUM_FEATURES) matrix of
+    normalized vectors to (n, num_classes) probabilities (see
+    ``build_predict_fn`` and ``NumpyClassifier``). Both may be swapped after
+    construction, which is how the API fills in the classifier once the model
+    has loaded.
+
+    Every stage is wrapped in ``timer(stage_name)`` when a timer is given, so
+    callers can feed per-stage histograms without the pipeline knowing about
+    metrics.
+    """
+
+    def __init__(self, detector=None, classifier=None, class_names=(), max_side=0, timer=None):
+        self.detector = detector
+        self.classifier = classifier
+        self.class_names = list(class_names)
+        self.max_side = max_side
+        self._timer = timer
+
+    def _stage(self, name):
+        return self._timer(name) if self._timer is not None else nullcontext()
+
+    def decode(self, data):
+        """Encoded image bytes to a BGR array, in memory; None if they are not an image"""
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        if buffer.size == 0:
+            return None
+        with self._stage('decode'):
+            return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+    def read(self, path):
+        with self._stage('decode'):
+            return cv2.imread(path)
+
+    def extract(self, img, detector=None, roi=None):
+        """Landmark vector for one BGR image, or None when no pose is found.
+
+        ``detector`` overrides the pipeline's own for this call (e.g. a live
+        session's tracking graph); ``roi`` is an optional ``RoiTracker`` whose
+        crop is applied before detection and updated from the result.
+        """
+        with self._stage('preprocess'):
+            img = downscale(img, self.max_side)
+            region = None
+            if roi is not None:
+                img, region = roi.crop(img)
+
+        try:
+            with self._stage('color_convert'):
+                rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            with self._stage('mediapipe'):
+                results = (detector or self.detector)(rgb)
+        except Exception:
+            # Never let a bad crop stick: the next frame starts from the full image
+            if region is not None:
+                roi.reset()
+            raise
+        with self._stage('landmarks'):
+            keypoints = pose_keypoints(results)
+            if roi is not None:
+                keypoints = roi.update(keypoints, region)
+        return keypoints
+
+    def extract_path(self, path):
+        img = self.read(path)
+        if img is None:
+            return None
+        return self.extract(img)
+
+    def extract_many(self, images, map_fn=map):
+        """Stack landmarks for many images into a float32 (n, NUM_FEATURES) matrix plus a found mask.
+
+        ``images`` may contain None (undecodable inputs), which count as not
+        found. ``map_fn`` lets callers fan the per-image work out, e.g. with
+        ``ThreadPoolExecutor.map``.
+        """
+        images = list(images)
+        matrix = np.zeros((len(images), NUM_FEATURES), dtype=KEYPOINT_DTYPE)
+        found = np.zeros(len(images), dtype=bool)
+        for i, keypoints in enumerate(map_fn(lambda img: None if img is None else self.extract(img), images)):
+            if keypoints is not None:
+                matrix[i] = keypoints
+                found[i] = True
+        return matrix, found
+
+    def normalize(self, vectors):
+        with self._stage('normalize'):
+            return normalize_keypoints(vectors)
+
+    def classify(self, vectors):
+        """Class probabilities for a float32 batch (or single vector) of normalized vectors"""
+        vectors = check_keypoints(vectors, 'classifier input').reshape(-1, NUM_FEATURES)
+        with self._stage('classifier'):
+            return self.classifier(vectors)
+
+    def predict(self, vectors):
+        """Normalize raw landmark vectors (one or a batch) and classify them; always returns a batch"""
+        return self.classify(self.normalize(np.asarray(vectors, dtype=KEYPOINT_DTYPE).reshape(-1, NUM_FEATURES)))
+
+    def predict_images(self, images, map_fn=map):
+        """Returns (probabilities for the images with a pose, found mask over all images)"""
+        matrix, found = self.extract_many(images, map_fn)
+        if not found.any():
+            return np.empty((0, len(self.class_names))), found
+        return self.predict(matrix[found]), found
+
+    def label(self, probabilities):
+        """(class name, confidence) for one row of probabilities"""
+        idx = int(np.argmax(probabilities))
+        return self.class_names[idx], float(probabilities[idx])
@@ -0,0 +1,90 @@
+"""Input downscaling and person-ROI cropping ahead of landmark extraction"""
+import cv2
+import numpy as np
+
+
+def downscale(img, max_side):
+    """Shrink ``img`` so its longest side is at most ``max_side`` (no-op when already smaller or max_side <= 0)"""
+    if not max_side or max_side <= 0:
+        return img
+    h, w = img.shape[:2]
+    longest = max(h, w)
+    if longest <= max_side:
+        return img
+    scale = max_side / longest
+    return cv2.resize(img, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+class RoiTracker:
+    """Crops live frames to the last known person bounding box plus ``padding``.
+
+    Landmarks found in the crop are mapped back to full-frame normalized
+    coordinates, so the classifier sees the same features as without cropping.
+    The crop is sticky: it is only recomputed when the person's box gets within
+    ``edge_margin`` of the crop border, because moving it every frame would
+    shift the image under MediaPipe's own frame-to-frame tracking.
+    """
+
+    def __init__(self, padding=0.25, min_visibility=0.5, edge_margin=0.05, min_size=0.05):
+        self.padding = padding
+        self.min_visibility = min_visibility
+        self.edge_margin = edge_margin
+        # Smallest crop (fraction of the frame per side); a thinner box means the person is off-frame
+        self.min_size = min_size
+        self.crop_box = None  # normalized (x0, y0, x1, y1) in full-frame coordinates
+
+    def reset(self):
+        self.crop_box = None
+
+    def crop(self, img):
+        """Return (cropped image, region); region is None when the full frame is used"""
+        if self.crop_box is None:
+            return img, None
+        h, w = img.shape[:2]
+        x0, y0, x1, y1 = self.crop_box
+        px0, py0 = min(int(x0 * w), w - 1), min(int(y0 * h), h - 1)
+        px1, py1 = max(px0 + 1, min(w, int(round(x1 * w)))), max(py0 + 1, min(h, int(round(y1 * h))))
+        return img[py0:py1, px0:px1], (px0, py0, px1 - px0, py1 - py0, w, h)
+
+    def _person_box(self, keypoints):
+        landmarks = keypoints.reshape(-1, 4)
+        visible = landmarks[landmarks[:, 3] >= self.min_visibility]
+        if len(visible) < 4:
+            return None
+        return visible[:, 0].min(), visible[:, 1].min(), visible[:, 0].max(), visible[:, 1].max()
+
+    def update(self, keypoints, region):
+        """Map crop-relative keypoints to the full frame and refresh the crop box if needed"""
+        if keypoints is None:
+            self.reset()
+            return None
+
+        if region is not None:
+            x0, y0, cw, ch, w, h = region
+            landmarks = np.array(keypoints, dtype=np.float32).reshape(-1, 4)
+            landmarks[:, 0] = (landmarks[:, 0] * cw + x0) / w
+            landmarks[:, 1] = (landmarks[:, 1] * ch + y0) / h
+            landmarks[:, 2] *= cw / w  # MediaPipe scales z like x
+            keypoints = landmarks.reshape(-1)
+
+        box = self._person_box(keypoints)
+        if box is None:
+            self.reset()
+            return keypoints
+
+        bx0, by0, bx1, by1 = box
+        if self.crop_box is not None:
+            cx0, cy0, cx1, cy1 = self.crop_box
+            mx, my = (cx1 - cx0) * self.edge_margin, (cy1 - cy0) * self.edge_margin
+            if bx0 > cx0 + mx and by0 > cy0 + my and bx1 < cx1 - mx and by1 < cy1 - my:
+                return keypoints
+
+        pad_x, pad_y = (bx1 - bx0) * self.padding, (by1 - by0) * self.padding
+        x0, y0 = float(np.clip(bx0 - pad_x, 0.0, 1.0)), float(np.clip(by0 - pad_y, 0.0, 1.0))
+        x1, y1 = float(np.clip(bx1 + pad_x, 0.0, 1.0)), float(np.clip(by1 + pad_y, 0.0, 1.0))
+        # Landmarks can lie outside the frame; if little of the box is inside, track the full frame
+        if x1 - x0 < self.min_size or y1 - y0 < self.min_size:
+            self.reset()
+        else:
+            self.crop_box = (x0, y0, x1, y1)
+        return keypoints
@@ -0,0 +1,144 @@
+"""Per-client MediaPipe sessions running in video (tracking) mode"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLimitError(RuntimeError):
+    pass
+
+
+class PoseSession:
+    """One live client: its own ``Pose`` graph plus whatever per-stream state callers attach"""
+
+    def __init__(self, session_id, detector):
+        self.id = session_id
+        self.detector = detector
+        self.lock = threading.Lock()
+        self.created = self.last_seen = time.monotonic()
+        self.frames = 0
+        self.state = {}
+        # Owned by an open connection (a /stream socket): never evicted as idle, closed by its owner
+        self.pinned = False
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def process(self, rgb):
+        """Run tracking on the next frame; frames of one session must be processed in order"""
+        with self.lock:
+            if self.detector is None:
+                raise RuntimeError(f"Session {self.id} is closed")
+            self.touch()
+            self.frames += 1
+            return self.detector.process(rgb)
+
+
+class SessionManager:
+    """Bounded set of live sessions with idle-timeout eviction.
+
+    With ``static_image_mode=False`` MediaPipe runs person detection once and
+    then tracks landmarks from frame to frame, which is both faster and less
+    jittery than detecting every frame from scratch. Each graph holds state and
+    memory, so sessions idle for ``idle_timeout`` seconds are closed and at
+    most ``max_sessions`` may exist at once. Sessions opened with
+    ``pinned=True`` belong to a live connection, which may pause for longer
+    (background tabs throttle their timers), and are only closed explicitly.
+    """
+
+    def __init__(self, max_sessions=32, idle_timeout=60.0, factory=None, registry=REGISTRY, **pose_kwargs):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        if factory is None:
+            pose_kwargs.setdefault('static_image_mode', False)
+
+            def factory():
+                from mediapipe.python.solutions import pose as mp_pose
+                return mp_pose.Pose(**pose_kwargs)
+        self._factory = factory
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._reaper = None
+
+        self.active = registry.gauge('profit_sessions_active', 'Live pose tracking sessions')
+        self.events = registry.counter(
+            'profit_session_events_total', 'Session lifecycle events', ('event',))
+
+    def _start_reaper(self):
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = threading.Thread(target=self._reap, name='session-reaper', daemon=True)
+            self._reaper.start()
+
+    def _reap(self):
+        while True:
+            time.sleep(max(1.0, self.idle_timeout / 2))
+            self.evict_idle()
+
+    def open(self, session_id=None, pinned=False):
+        """Return the session for ``session_id``, creating it (and a new graph) if needed"""
+        session_id = session_id or uuid.uuid4().hex
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.touch()
+                return session
+        self.evict_idle()
+
+        with self._lock:
+            if len(self._sessions) >= self.max_sessions:
+                self.events.inc(event='rejected')
+                raise SessionLimitError(f"Session limit reached ({self.max_sessions})")
+            session = PoseSession(session_id, None)
+            session.pinned = pinned
+            # Held until the graph exists so concurrent frames for this id wait for it
+            session.lock.acquire()
+            self._sessions[session_id] = session
+            self.active.set(len(self._sessions))
+        self._start_reaper()
+
+        try:
+            session.detector = self._factory()
+        except Exception:
+            with self._lock:
+                self._sessions.pop(session_id, None)
+                self.active.set(len(self._sessions))
+            raise
+        finally:
+            session.lock.release()
+        self.events.inc(event='opened')
+        return session
+
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def close(self, session_id, reason='closed'):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            self.active.set(len(self._sessions))
+        if session is None:
+            return
+        with session.lock:
+            if session.detector is not None:
+                session.detector.close()
+                session.detector = None
+        self.events.inc(event=reason)
+
+    def evict_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            idle = [sid for sid, s in self._sessions.items()
+                    if s.last_seen < cutoff and not s.pinned and not s.lock.locked()]
+        for session_id in idle:
+            logger.info(f"Evicting idle pose session {session_id}")
+            self.close(session_id, reason='evicted')
+
+    def __len__(self):
+        return len(self._sessions)
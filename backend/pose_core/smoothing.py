@@ -0,0 +1,147 @@
+"""Temporal smoothing and debouncing for live pose predictions"""
+import math
+
+import numpy as np
+
+
+class OneEuroFilter:
+    """Vectorized one-euro filter (Casiez et al.) for landmark coordinates.
+
+    Low speeds get a low cutoff (less jitter while a pose is held); fast
+    movement raises the cutoff through ``beta`` so the filter keeps up.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.05, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._dx = None
+        self._t = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, x, t):
+        x = np.asarray(x, dtype=np.float32)
+        if self._x is None:
+            self._x = x.copy()
+            self._dx = np.zeros_like(x)
+            self._t = t
+            return x.copy()
+
+        dt = max(t - self._t, 1e-6)
+        self._t = t
+        a_d = self._alpha(self.d_cutoff, dt)
+        self._dx = a_d * (x - self._x) / dt + (1 - a_d) * self._dx
+        a = self._alpha(self.min_cutoff + self.beta * np.abs(self._dx), dt)
+        self._x = a * x + (1 - a) * self._x
+        return self._x.copy()
+
+
+class PredictionSmoother:
+    """EMA over class probabilities with hysteresis on the reported class.
+
+    The reported pose only changes once another class has led the averaged
+    probabilities by ``switch_margin`` for ``hold_frames`` consecutive frames.
+    """
+
+    def __init__(self, alpha=0.4, hold_frames=3, switch_margin=0.1, min_confidence=0.3):
+        self.alpha = alpha
+        self.hold_frames = hold_frames
+        self.switch_margin = switch_margin
+        self.min_confidence = min_confidence
+        self.reset()
+
+    def reset(self):
+        self.probabilities = None
+        self.current = None
+        self._candidate = None
+        self._streak = 0
+        self._frame_top = None
+
+    @property
+    def settled(self):
+        """True when the last frame, the average and the reported class all agree and no switch is pending"""
+        return (self.current is not None and self._candidate is None and self._frame_top == self.current
+                and int(np.argmax(self.probabilities)) == self.current)
+
+    def update(self, probabilities):
+        """Fold in one frame; return True if the reported class changed"""
+        probabilities = np.asarray(probabilities, dtype=np.float32)
+        self._frame_top = int(np.argmax(probabilities))
+        if self.probabilities is None:
+            self.probabilities = probabilities.copy()
+        else:
+            self.probabilities *= 1 - self.alpha
+            self.probabilities += self.alpha * probabilities
+
+        top = int(np.argmax(self.probabilities))
+        if self.current is None:
+            if self.probabilities[top] < self.min_confidence:
+                return False
+            self.current = top
+            return True
+
+        if top == self.current or self.probabilities[top] - self.probabilities[self.current] < self.switch_margin:
+            self._candidate = None
+            self._streak = 0
+            return False
+
+        if top == self._candidate:
+            self._streak += 1
+        else:
+            self._candidate = top
+            self._streak = 1
+        if self._streak < self.hold_frames:
+            return False
+
+        self.current = top
+        self._candidate = None
+        self._streak = 0
+        return True
+
+
+class LiveSmoother:
+    """Per-session state: landmark filter, probability smoother and lost-pose tracking"""
+
+    def __init__(self, alpha=0.4, hold_frames=3, switch_margin=0.1, min_confidence=0.3,
+                 min_cutoff=1.0, beta=0.05, lost_after=10):
+        self.landmarks = OneEuroFilter(min_cutoff=min_cutoff, beta=beta)
+        self.predictions = PredictionSmoother(alpha, hold_frames, switch_margin, min_confidence)
+        self.lost_after = lost_after
+        self._misses = 0
+
+    @property
+    def current(self):
+        return self.predictions.current
+
+    @property
+    def probabilities(self):
+        return self.predictions.probabilities
+
+    @property
+    def settled(self):
+        return self.predictions.settled
+
+    def filter_landmarks(self, keypoints, t):
+        self._misses = 0
+        return self.landmarks(keypoints, t)
+
+    def update(self, probabilities):
+        return self.predictions.update(probabilities)
+
+    def miss(self):
+        """Record a frame without landmarks; return True once when the pose counts as lost"""
+        self._misses += 1
+        if self._misses != self.lost_after:
+            return False
+        had_pose = self.predictions.current is not None
+        self.landmarks.reset()
+        self.predictions.reset()
+        return had_pose
@@ -0,0 +1,88 @@
+"""Latest-frame-wins processing for streaming connections"""
+import logging
+import threading
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class FrameStream:
+    """Decouples a socket reader from frame processing for one connection.
+
+    The reader calls ``push`` for every incoming frame; a single worker thread
+    always processes the newest frame and hands the result to ``send``. Frames
+    that arrive while the worker is busy replace the pending one, so a slow
+    server drops frames instead of building up latency.
+    """
+
+    def __init__(self, process_frame, send, name='stream', registry=REGISTRY):
+        self.process_frame = process_frame
+        self.send = send
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending = None
+        self._closed = False
+        self._thread = None
+        self.frames_received = 0
+
+        self.frames = registry.counter(
+            'profit_stream_frames_total', 'Streamed frames by outcome', ('outcome',))
+        self.active = registry.gauge(
+            'profit_stream_active_connections', 'Open streaming connections')
+
+    def start(self):
+        self.active.inc()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def push(self, frame):
+        with self._cond:
+            self.frames_received += 1
+            if self._pending is not None:
+                self.frames.inc(outcome='dropped')
+            self._pending = (self.frames_received, frame)
+            self._cond.notify()
+
+    def close(self, timeout=5):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            self.active.dec()
+
+    def _next(self):
+        with self._cond:
+            while self._pending is None and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+            pending, self._pending = self._pending, None
+            return pending
+
+    def _run(self):
+        while True:
+            pending = self._next()
+            if pending is None:
+                break
+            seq, frame = pending
+            try:
+                result = self.process_frame(frame)
+            except Exception as e:
+                logger.error(f"{self.name}: frame {seq} failed: {e}")
+                self.frames.inc(outcome='error')
+                result = {'error': 'Frame processing failed'}
+            else:
+                self.frames.inc(outcome='processed')
+            if result is None:
+                continue
+            result['frame'] = seq
+            try:
+                self.send(result)
+            except Exception as e:
+                logger.info(f"{self.name}: send failed, closing stream: {e}")
+                with self._cond:
+                    self._closed = True
+                break
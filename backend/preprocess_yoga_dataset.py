@@ -1,7 +1,7 @@
 import numpy as np
 import tensorflow as tf
-import json
 import os
+from pose_core.labels import load_labels
 from sklearn.metrics import classification_report, confusion_matrix
 import seaborn as sns
 import matplotlib.pyplot as plt
@@ -12,8 +12,7 @@ X_val = np.load(os.path.join(DATA_PATH, 'X_val.npy'))
 y_val = np.load(os.path.join(DATA_PATH, 'y_val.npy'))
 
 # Load class names
-with open(os.path.join(DATA_PATH, 'yoga_pose_model_labels.json')) as f:
-    class_names = json.load(f)['classes']
+class_names = load_labels(os.path.join(DATA_PATH, 'yoga_pose_model_labels.json'), normalize=False)
 
 # Load trained model
 model = tf.keras.models.load_model('yoga_pose_model.h5')
@@ -0,0 +1,107 @@
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import tensorflow as tf
+
+from pose_core import NumpyClassifier, OnnxClassifier, PosePipeline, export_onnx
+from pose_core.onnx_backend import export_onnx_int8
+from pose_core.export import top1_accuracy
+
+MODEL_PATH = 'yoga_pose_model.h5'
+BATCH_SIZES = [1, 7, 64, 256]
+
+model = tf.keras.models.load_model(MODEL_PATH, compile=False)
+engine = NumpyClassifier.from_keras(model)
+
+
+def random_keypoints(batch_size, seed=0):
+    """Normalized keypoint vectors shaped like the ones /predict feeds the model"""
+    rng = np.random.default_rng(seed)
+    keypoints = rng.random((batch_size, engine.input_dim), dtype=np.float32)
+    return keypoints / np.linalg.norm(keypoints, axis=1, keepdims=True)
+
+
+def check_parity(predict_fn, label, atol=1e-5):
+    for batch_size in BATCH_SIZES:
+        x = random_keypoints(batch_size, seed=batch_size)
+        expected = model.predict(x, verbose=0)
+        actual = predict_fn(x)
+        np.testing.assert_allclose(actual, expected, atol=atol, rtol=1e-4)
+        assert (actual.argmax(axis=1) == expected.argmax(axis=1)).all()
+    print(f"[✓] {label} matches Keras for batch sizes {BATCH_SIZES}")
+
+
+def test_numpy_engine_matches_keras():
+    check_parity(engine.predict, "NumPy engine")
+
+
+def test_tf_function_matches_keras():
+    check_parity(engine.as_tf_function(), "tf.function engine")
+
+
+def test_weight_pack_round_trip(tmp_path):
+    path = str(tmp_path / 'engine_weights.npz')
+    engine.save(path)
+    check_parity(NumpyClassifier.load(path).predict, "NumPy weight pack")
+
+
+def test_pipeline_normalizes_then_classifies():
+    pipeline = PosePipeline(classifier=engine.predict)
+    raw = np.random.default_rng(1).random((16, engine.input_dim), dtype=np.float32) * 3
+    expected = model.predict(raw / np.linalg.norm(raw, axis=1, keepdims=True), verbose=0)
+    np.testing.assert_allclose(pipeline.predict(raw), expected, atol=1e-5, rtol=1e-4)
+    np.testing.assert_allclose(pipeline.predict(raw[0]), expected[:1], atol=1e-5, rtol=1e-4)
+    print("[✓] PosePipeline.predict matches normalize + Keras for single vectors and batches")
+
+
+def test_quantized_packs_keep_predictions(tmp_path, min_agreement=0.98):
+    x = random_keypoints(512, seed=3)
+    expected = model.predict(x, verbose=0).argmax(axis=1)
+    for precision in ('float16', 'int8'):
+        path = str(tmp_path / f'engine_weights.{precision}.npz')
+        engine.save(path, precision)
+        agreement = top1_accuracy(NumpyClassifier.load(path).predict, x, expected)
+        assert agreement >= min_agreement, f"{precision} agrees with Keras on only {agreement:.1%}"
+        print(f"[✓] {precision} weight pack agrees with Keras on {agreement:.1%} of top-1 predictions")
+
+
+def test_onnx_runtime_matches_keras(tmp_path):
+    path = str(tmp_path / 'engine.onnx')
+    export_onnx(engine, path)
+    check_parity(OnnxClassifier(path).predict, "ONNX Runtime engine")
+    # A worker serving the ONNX model must not pull TensorFlow in
+    probe = (
+        "import sys, numpy as np\n"
+        "from pose_core import OnnxClassifier\n"
+        f"OnnxClassifier({path!r}).predict(np.zeros((3, {engine.input_dim}), np.float32))\n"
+        "assert 'tensorflow' not in sys.modules, 'tensorflow was imported'\n"
+    )
+    subprocess.run([sys.executable, '-c', probe], check=True)
+    print("[✓] ONNX Runtime engine loads and runs without importing TensorFlow")
+
+
+def test_int8_onnx_keeps_predictions(tmp_path, min_agreement=0.95):
+    x = random_keypoints(512, seed=4)
+    expected = model.predict(x, verbose=0).argmax(axis=1)
+    path = str(tmp_path / 'engine.int8.onnx')
+    export_onnx_int8(engine, path)
+    agreement = top1_accuracy(OnnxClassifier(path).predict, x, expected)
+    # Activations are quantized per batch too, so this sits a little below the int8 weight pack
+    assert agreement >= min_agreement, f"int8 ONNX agrees with Keras on only {agreement:.1%}"
+    print(f"[✓] int8 ONNX model agrees with Keras on {agreement:.1%} of top-1 predictions")
+
+
+if __name__ == '__main__':
+    # Outside pytest, give the file-writing tests a scratch directory like its tmp_path fixture
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = pathlib.Path(tmp)
+        test_numpy_engine_matches_keras()
+        test_tf_function_matches_keras()
+        test_weight_pack_round_trip(scratch)
+        test_pipeline_normalizes_then_classifies()
+        test_quantized_packs_keep_predictions(scratch)
+        test_onnx_runtime_matches_keras(scratch)
+        test_int8_onnx_keeps_predictions(scratch)
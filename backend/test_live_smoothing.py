@@ -0,0 +1,52 @@
+import numpy as np
+
+from pose_core import LiveSmoother, MetricsRegistry, MotionGate
+
+NUM_CLASSES = 4
+HOLD_FRAMES = 3
+
+
+def still_frame(level, i):
+    """A held pose: the same scene each frame plus a little sensor noise"""
+    rng = np.random.default_rng(i)
+    return np.clip(level + rng.integers(-1, 2, (120, 160, 3)), 0, 255).astype(np.uint8)
+
+
+def scripted_sequence(change_at=40, length=120):
+    """Pose 0 held, then pose 1 held from ``change_at``; each frame carries its classifier output"""
+    frames = []
+    for i in range(length):
+        pose = 0 if i < change_at else 1
+        probabilities = np.full(NUM_CLASSES, 0.02, dtype=np.float32)
+        probabilities[pose] = 1 - 0.02 * (NUM_CLASSES - 1)
+        frames.append((still_frame(60 if pose == 0 else 180, i), probabilities))
+    return frames
+
+
+def run_session(frames, motion_threshold):
+    """Frame index of every reported change and the number of frames the gate skipped"""
+    smoother = LiveSmoother(hold_frames=HOLD_FRAMES)
+    gate = MotionGate(threshold=motion_threshold, max_skips=15, registry=MetricsRegistry())
+    changes = []
+    for i, (img, probabilities) in enumerate(frames):
+        if gate.should_skip(img, smoother):
+            continue
+        if smoother.update(probabilities):
+            changes.append(i)
+    return changes, gate.skipped
+
+
+def test_gate_does_not_delay_pose_switch(change_at=40):
+    frames = scripted_sequence(change_at)
+    ungated, _ = run_session(frames, motion_threshold=0)
+    gated, skipped = run_session(frames, motion_threshold=3)
+
+    assert gated == ungated, f"gate changed when switches are reported: {gated} vs {ungated}"
+    # One frame for the average to cross over, then hold_frames frames of hysteresis
+    assert gated[-1] - change_at <= HOLD_FRAMES, f"switch reported at frame {gated[-1]}"
+    assert skipped > 0, "held poses should still be skipped once the smoother has settled"
+    print(f"[✓] pose switch reported {gated[-1] - change_at} frames after the change; {skipped} held frames skipped")
+
+
+if __name__ == '__main__':
+    test_gate_does_not_delay_pose_switch()
@@ -1,10 +1,10 @@
 import os
-import cv2
 import numpy as np
 import tensorflow as tf
-import json
 from mediapipe.python.solutions import pose as mp_pose
 from PIL import Image
+from pose_core import PosePipeline, build_predict_fn, load_labels
+from pose_core.keypoint_cache import DATASET_POSE_SETTINGS, DEFAULT_CACHE_DIR, KeypointCache
 
 # Paths to model and labels
 MODEL_PATH = 'yoga_pose_model.h5'
@@ -15,44 +15,37 @@ TEST_IMAGES_DIR = 'yoga_dataset/test/Dolphin_Pose_or_Ardha_Pincha_Mayurasana_'
 model = tf.keras.models.load_model(MODEL_PATH)
 
 # Load class labels
-with open(LABELS_PATH, 'r') as f:
-    class_names = json.load(f)['classes']
+class_names = load_labels(LABELS_PATH, normalize=False)
 
-# Initialize MediaPipe Pose
-pose_detector = mp_pose.Pose(static_image_mode=True)
+# Initialize MediaPipe Pose with the dataset settings so results can be shared with the trainer's cache
+pose_detector = mp_pose.Pose(**DATASET_POSE_SETTINGS)
+keypoint_cache = KeypointCache(DEFAULT_CACHE_DIR, DATASET_POSE_SETTINGS)
+pipeline = PosePipeline(
+    detector=pose_detector.process,
+    classifier=build_predict_fn(model, 'keras'),
+    class_names=class_names,
+)
 
 def extract_keypoints(image_path):
-    img = cv2.imread(image_path)
-    rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    results = pose_detector.process(rgb)
-
-    if results.pose_landmarks:
-        keypoints = []
-        for landmark in results.pose_landmarks.landmark:
-            keypoints.extend([landmark.x, landmark.y, landmark.z, landmark.visibility])
-        return np.array(keypoints)
-    else:
-        return None
-
-def predict_pose(image_path):
-    keypoints = extract_keypoints(image_path)
-
-    if keypoints is None:
-        print(f"[✘] No landmarks detected in: {image_path}")
-        return
-
-    keypoints_norm = keypoints / np.linalg.norm(keypoints)
-    keypoints_norm = keypoints_norm.reshape(1, -1)
-
-    prediction = model.predict(keypoints_norm, verbose=0)
-    predicted_idx = np.argmax(prediction)
-    confidence = prediction[0][predicted_idx]
-
-    print(f"[✓] {os.path.basename(image_path)} ➜ Pose: {class_names[predicted_idx]} (Confidence: {confidence*100:.2f}%)")
+    return pipeline.extract_path(image_path)
+
+def predict_poses(image_paths, all_keypoints):
+    """Classify every image with landmarks in one batch and print one line per image"""
+    found = [i for i, keypoints in enumerate(all_keypoints) if keypoints is not None]
+    predictions = dict(zip(found, pipeline.predict(np.stack([all_keypoints[i] for i in found])))) if found else {}
+    for i, image_path in enumerate(image_paths):
+        if i not in predictions:
+            print(f"[✘] No landmarks detected in: {image_path}")
+            continue
+        pose_name, confidence = pipeline.label(predictions[i])
+        print(f"[✓] {os.path.basename(image_path)} ➜ Pose: {pose_name} (Confidence: {confidence*100:.2f}%)")
 
 # Run predictions on all test images
 if __name__ == '__main__':
-    for filename in os.listdir(TEST_IMAGES_DIR):
-        if filename.lower().endswith(('.jpg', '.png', '.jpeg')):
-            image_path = os.path.join(TEST_IMAGES_DIR, filename)
-            predict_pose(image_path)
+    image_paths = [
+        os.path.join(TEST_IMAGES_DIR, filename)
+        for filename in os.listdir(TEST_IMAGES_DIR)
+        if filename.lower().endswith(('.jpg', '.png', '.jpeg'))
+    ]
+    all_keypoints = keypoint_cache.resolve(image_paths, lambda paths: map(extract_keypoints, paths))
+    predict_poses(image_paths, all_keypoints)
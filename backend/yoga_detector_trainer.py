@@ -1,12 +1,5 @@
-import cv2
 import numpy as np
 import mediapipe as mp
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense, Dropout, BatchNormalization
-from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 import json
@@ -14,23 +7,66 @@ import os
 import logging
 from PIL import Image
 import glob
-import matplotlib.pyplot as plt
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pose_core.dataset import KeypointShards, make_dataset, stratified_split
+from pose_core.engine import NumpyClassifier
+from pose_core.extraction import extract_keypoints_with, extract_keypoints_worker, init_extraction_worker
+from pose_core.export import DEFAULT_MAX_ACCURACY_DROP, export_variants
+from pose_core.onnx_backend import export_onnx, onnx_path
+from pose_core.keypoint_cache import DATASET_POSE_SETTINGS, DEFAULT_CACHE_DIR, NO_POSE, KeypointCache
+from pose_core.landmarks import KEYPOINT_DTYPE, NUM_FEATURES, check_keypoints
+from pose_core.pipeline import PosePipeline
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+PROGRESS_EVERY = 500
+
+# Landmark templates for synthetic data: first matching keyword group wins
+SYNTHETIC_POSE_TEMPLATES = [
+    # Standing poses - feet on ground, upright posture
+    (('Mountain', 'Standing'), [
+        (slice(91, 95), [0.3, 0.9, 0.0, 0.9]),  # Left ankle
+        (slice(95, 99), [0.7, 0.9, 0.0, 0.9]),  # Right ankle
+        (slice(43, 47), [0.5, 0.3, 0.0, 0.9]),  # Nose - centered and high
+    ]),
+    # Seated/ground poses
+    (('Child', 'Seated'), [
+        (slice(91, 95), [0.3, 0.7, 0.0, 0.9]),  # Left ankle
+        (slice(95, 99), [0.7, 0.7, 0.0, 0.9]),  # Right ankle
+        (slice(43, 47), [0.5, 0.6, 0.0, 0.9]),  # Nose - lower
+    ]),
+    # Warrior poses - wide stance
+    (('Warrior',), [
+        (slice(91, 95), [0.2, 0.8, 0.0, 0.9]),  # Left ankle
+        (slice(95, 99), [0.8, 0.8, 0.0, 0.9]),  # Right ankle
+        (slice(43, 47), [0.5, 0.3, 0.0, 0.9]),  # Nose
+    ]),
+    # Downward dog - inverted V shape
+    (('Downward',), [
+        (slice(63, 67), [0.3, 0.7, 0.0, 0.9]),  # Left wrist
+        (slice(67, 71), [0.7, 0.7, 0.0, 0.9]),  # Right wrist
+        (slice(91, 95), [0.3, 0.8, 0.0, 0.9]),  # Left ankle
+        (slice(95, 99), [0.7, 0.8, 0.0, 0.9]),  # Right ankle
+        (slice(43, 47), [0.5, 0.75, 0.0, 0.9]),  # Nose - between hands and feet
+    ]),
+]
+
+def synthetic_pose_template(pose_class):
+    for keywords, assignments in SYNTHETIC_POSE_TEMPLATES:
+        if any(keyword in pose_class for keyword in keywords):
+            return assignments
+    return []
+
 class YogaPoseTrainer:
     def __init__(self):
         # Initialize MediaPipe pose detection
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=True,
-            model_complexity=1,
-            enable_segmentation=False,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.pose = self.mp_pose.Pose(**DATASET_POSE_SETTINGS)
+        self.pipeline = PosePipeline(detector=self.pose.process)
         
         # Yoga pose classes (matching your Flask app)
         self.pose_classes = [
@@ -58,92 +94,109 @@ class YogaPoseTrainer:
         
         self.label_encoder = LabelEncoder()
         self.label_encoder.fit(self.pose_classes)
+        # Test split of the last train_model call, for the export accuracy gate
+        self.held_out = None
         
     def extract_keypoints(self, image_path):
         """Extract pose keypoints from an image using MediaPipe"""
-        try:
-            # Read image
-            image = cv2.imread(image_path)
-            if image is None:
-                return None
-            
-            # Convert to RGB
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Process the image
-            results = self.pose.process(rgb_image)
-            
-            if results.pose_landmarks:
-                # Extract keypoints
-                keypoints = []
-                for landmark in results.pose_landmarks.landmark:
-                    keypoints.extend([landmark.x, landmark.y, landmark.z, landmark.visibility])
-                
-                return np.array(keypoints)
-            else:
-                return None
-        except Exception as e:
-            logger.error(f"Error extracting keypoints from {image_path}: {e}")
-            return None
+        return extract_keypoints_with(self.pipeline, image_path)
     
-    def generate_synthetic_data(self, num_samples_per_class=100):
-        """Generate synthetic training data for yoga poses"""
+    def generate_synthetic_data(self, num_samples_per_class=100, rng=None):
+        """Generate synthetic training data for yoga poses
+        
+        Each class is built as one float32 ``(n, 132)`` block; ``rng`` may be a
+        seed or a ``np.random.Generator`` for reproducible output.
+        """
         logger.info("Generating synthetic training data...")
+        rng = np.random.default_rng(rng)
         
-        X = []
-        y = []
+        n = num_samples_per_class
+        num_classes = len(self.pose_classes)
         
-        # Generate synthetic keypoints for each pose class
-        for pose_class in self.pose_classes:
-            logger.info(f"Generating data for {pose_class}...")
+        # Base keypoints (33 landmarks * 4 coordinates each = 132 features), values between 0.1 and 0.9
+        X = rng.random((num_classes * n, NUM_FEATURES), dtype=KEYPOINT_DTYPE)
+        X *= 0.8
+        X += 0.1
+        y = np.repeat(np.array(self.pose_classes), n)
+        
+        for i, pose_class in enumerate(self.pose_classes):
+            block = X[i * n:(i + 1) * n]
             
-            for _ in range(num_samples_per_class):
-                # Generate synthetic keypoints (33 landmarks * 4 coordinates each = 132 features)
-                # Add some realistic constraints and variations
-                
-                # Base keypoints with some pose-specific modifications
-                keypoints = np.random.rand(132) * 0.8 + 0.1  # Values between 0.1 and 0.9
-                
-                # Add pose-specific patterns
-                if 'Mountain' in pose_class or 'Standing' in pose_class:
-                    # Standing poses - feet on ground, upright posture
-                    keypoints[91:95] = [0.3, 0.9, 0.0, 0.9]  # Left ankle
-                    keypoints[95:99] = [0.7, 0.9, 0.0, 0.9]  # Right ankle
-                    keypoints[43:47] = [0.5, 0.3, 0.0, 0.9]  # Nose - centered and high
-                
-                elif 'Child' in pose_class or 'Seated' in pose_class:
-                    # Seated/ground poses
-                    keypoints[91:95] = [0.3, 0.7, 0.0, 0.9]  # Left ankle
-                    keypoints[95:99] = [0.7, 0.7, 0.0, 0.9]  # Right ankle
-                    keypoints[43:47] = [0.5, 0.6, 0.0, 0.9]  # Nose - lower
-                
-                elif 'Warrior' in pose_class:
-                    # Warrior poses - wide stance
-                    keypoints[91:95] = [0.2, 0.8, 0.0, 0.9]  # Left ankle
-                    keypoints[95:99] = [0.8, 0.8, 0.0, 0.9]  # Right ankle
-                    keypoints[43:47] = [0.5, 0.3, 0.0, 0.9]  # Nose
+            # Add pose-specific patterns
+            for landmark_slice, values in synthetic_pose_template(pose_class):
+                block[:, landmark_slice] = values
+            
+            # Add noise for variation, one class block at a time to bound peak memory
+            block += 0.02 * rng.standard_normal(block.shape, dtype=KEYPOINT_DTYPE)
+            np.clip(block, 0, 1, out=block)  # Keep values in valid range
+        
+        logger.info(f"Generated {len(X)} samples across {num_classes} classes")
+        return X, y
+    
+    def extract_many(self, image_files, workers=1):
+        """Yield keypoints for each image in order, optionally across a process pool
+        
+        With ``workers > 1`` images are spread across a process pool (one
+        MediaPipe Pose per worker); ``executor.map`` returns results in input
+        order, so the output is identical to the serial path.
+        """
+        if workers > 1 and len(image_files) > 1:
+            # spawn keeps TensorFlow out of the workers: the worker functions live in pose_core,
+            # and this module (re-imported as __mp_main__) only imports TensorFlow inside methods
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_extraction_worker
+            )
+            results = executor.map(extract_keypoints_worker, image_files,
+                                   chunksize=max(1, min(32, len(image_files) // (workers * 4))))
+        else:
+            executor = None
+            results = map(self.extract_keypoints, image_files)
+        
+        start = time.perf_counter()
+        detected = 0
+        try:
+            for i, keypoints in enumerate(results, 1):
+                if keypoints is not None:
+                    detected += 1
+                yield keypoints
                 
-                elif 'Downward' in pose_class:
-                    # Downward dog - inverted V shape
-                    keypoints[63:67] = [0.3, 0.7, 0.0, 0.9]  # Left wrist
-                    keypoints[67:71] = [0.7, 0.7, 0.0, 0.9]  # Right wrist
-                    keypoints[91:95] = [0.3, 0.8, 0.0, 0.9]  # Left ankle
-                    keypoints[95:99] = [0.7, 0.8, 0.0, 0.9]  # Right ankle
-                    keypoints[43:47] = [0.5, 0.75, 0.0, 0.9]  # Nose - between hands and feet
+                if i % PROGRESS_EVERY == 0 or i == len(image_files):
+                    elapsed = time.perf_counter() - start
+                    logger.info(f"Processed {i}/{len(image_files)} images "
+                                f"({i / elapsed:.1f} images/s, {detected} with landmarks)")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    
+    def list_image_files(self, data_dir):
+        """Return (image_files, image_classes) in class order"""
+        # Expected directory structure: data_dir/pose_name/image_files
+        image_files = []
+        image_classes = []
+        for pose_class in self.pose_classes:
+            pose_dir = os.path.join(data_dir, pose_class.replace(' ', '_'))
+            if os.path.exists(pose_dir):
+                class_files = glob.glob(os.path.join(pose_dir, '*.jpg')) + \
+                             glob.glob(os.path.join(pose_dir, '*.png')) + \
+                             glob.glob(os.path.join(pose_dir, '*.jpeg'))
                 
-                # Add noise for variation
-                noise = np.random.normal(0, 0.02, 132)
-                keypoints += noise
-                keypoints = np.clip(keypoints, 0, 1)  # Keep values in valid range
+                image_files.extend(class_files)
+                image_classes.extend([pose_class] * len(class_files))
                 
-                X.append(keypoints)
-                y.append(pose_class)
+                if class_files:
+                    logger.info(f"Found {len(class_files)} images for {pose_class}")
         
-        logger.info(f"Generated {len(X)} samples across {len(self.pose_classes)} classes")
-        return np.array(X), np.array(y)
+        return image_files, image_classes
     
-    def load_real_data(self, data_dir):
-        """Load real yoga pose images from directory structure"""
+    def load_real_data(self, data_dir, workers=1, cache_dir=DEFAULT_CACHE_DIR):
+        """Load real yoga pose images from directory structure
+        
+        Landmarks are looked up in the keypoint cache at ``cache_dir`` first, so
+        only new or changed images go through MediaPipe. Pass ``cache_dir=None``
+        to always extract.
+        """
         logger.info(f"Loading real data from {data_dir}...")
         
         X = []
@@ -151,30 +204,32 @@ class YogaPoseTrainer:
         
         if not os.path.exists(data_dir):
             logger.warning(f"Data directory {data_dir} not found. Using synthetic data only.")
-            return np.array(X), np.array(y)
+            return np.empty((0, NUM_FEATURES), dtype=KEYPOINT_DTYPE), np.array(y)
         
-        # Expected directory structure: data_dir/pose_name/image_files
-        for pose_class in self.pose_classes:
-            pose_dir = os.path.join(data_dir, pose_class.replace(' ', '_'))
-            if os.path.exists(pose_dir):
-                image_files = glob.glob(os.path.join(pose_dir, '*.jpg')) + \
-                             glob.glob(os.path.join(pose_dir, '*.png')) + \
-                             glob.glob(os.path.join(pose_dir, '*.jpeg'))
-                
-                for image_file in image_files:
-                    keypoints = self.extract_keypoints(image_file)
-                    if keypoints is not None:
-                        X.append(keypoints)
-                        y.append(pose_class)
-                
-                if image_files:
-                    logger.info(f"Loaded {len(image_files)} images for {pose_class}")
+        image_files, image_classes = self.list_image_files(data_dir)
+        
+        if cache_dir:
+            cache = KeypointCache(cache_dir, DATASET_POSE_SETTINGS)
+            all_keypoints = cache.resolve(image_files, lambda paths: self.extract_many(paths, workers))
+        else:
+            all_keypoints = self.extract_many(image_files, workers)
+        
+        for keypoints, pose_class in zip(all_keypoints, image_classes):
+            if keypoints is not None:
+                X.append(keypoints)
+                y.append(pose_class)
         
         logger.info(f"Loaded {len(X)} real samples")
-        return np.array(X), np.array(y)
+        if not X:
+            return np.empty((0, NUM_FEATURES), dtype=KEYPOINT_DTYPE), np.array(y)
+        return np.stack(X), np.array(y)
     
     def create_model(self, input_shape):
         """Create the neural network model"""
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import Dense, Dropout, BatchNormalization
+        from tensorflow.keras.optimizers import Adam
+        
         model = Sequential([
             Dense(512, activation='relu', input_shape=(input_shape,)),
             BatchNormalization(),
@@ -202,36 +257,99 @@ class YogaPoseTrainer:
         
         return model
     
-    def train_model(self, data_dir=None, epochs=100, batch_size=32):
-        """Train the yoga pose detection model"""
-        logger.info("Starting model training...")
+    def build_streaming_datasets(self, data_dir=None, batch_size=32, workers=1, cache_dir=DEFAULT_CACHE_DIR,
+                                 seed=None, shuffle_buffer=10000, augment_noise=0.0):
+        """Build lazily-read train/test tf.data pipelines over the keypoint cache
+        
+        Real samples stay in the cache memmap and synthetic samples in one small
+        block; only row numbers and labels are held in memory, and the
+        stratified split is done on those indices.
+        """
+        shards = []
+        rows = []
+        labels = []
+        num_synthetic = 200  # More synthetic data if no real data
         
-        # Load data
         if data_dir and os.path.exists(data_dir):
-            X_real, y_real = self.load_real_data(data_dir)
-            X_synthetic, y_synthetic = self.generate_synthetic_data(50)  # Less synthetic data if we have real data
-            
-            if len(X_real) > 0:
-                X = np.vstack([X_real, X_synthetic])
-                y = np.hstack([y_real, y_synthetic])
-            else:
-                X, y = X_synthetic, y_synthetic
-        else:
-            X, y = self.generate_synthetic_data(200)  # More synthetic data if no real data
+            if not cache_dir:
+                raise ValueError("Streaming training reads landmarks from the keypoint cache; cache_dir is required")
+            image_files, image_classes = self.list_image_files(data_dir)
+            cache = KeypointCache(cache_dir, DATASET_POSE_SETTINGS)
+            cache_rows = cache.resolve_rows(image_files, lambda paths: self.extract_many(paths, workers))
+            detected = cache_rows != NO_POSE
+            if detected.any():
+                shards.append(cache.array)
+                rows.append(cache_rows[detected])
+                labels.append(np.array(image_classes)[detected])
+                num_synthetic = 50  # Less synthetic data if we have real data
+            logger.info(f"Streaming {int(detected.sum())} real samples from {cache_dir}")
         
-        # Encode labels
-        y_encoded = self.label_encoder.transform(y)
+        X_synthetic, y_synthetic = self.generate_synthetic_data(num_synthetic, rng=seed)
+        shards.append(X_synthetic)
+        rows.append(np.arange(len(X_synthetic)))
+        labels.append(y_synthetic)
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
-        )
+        shard_view = KeypointShards(shards)
+        global_rows = np.concatenate([shard_view.global_rows(i, r) for i, r in enumerate(rows)])
+        y_encoded = self.label_encoder.transform(np.concatenate(labels))
+        
+        train_idx, test_idx = stratified_split(y_encoded, test_size=0.2, random_state=42)
+        
+        train_ds = make_dataset(shard_view, global_rows[train_idx], y_encoded[train_idx], batch_size,
+                                training=True, shuffle_buffer=shuffle_buffer,
+                                augment_noise=augment_noise, seed=seed)
+        test_ds = make_dataset(shard_view, global_rows[test_idx], y_encoded[test_idx], batch_size)
+        return train_ds, test_ds, len(train_idx), len(test_idx), shard_view.num_features
+    
+    def train_model(self, data_dir=None, epochs=100, batch_size=32, workers=1, cache_dir=DEFAULT_CACHE_DIR,
+                    seed=None, streaming=False, shuffle_buffer=10000, augment_noise=0.0):
+        """Train the yoga pose detection model
         
-        logger.info(f"Training set: {X_train.shape[0]} samples")
-        logger.info(f"Test set: {X_test.shape[0]} samples")
+        ``streaming=True`` feeds Keras from ``build_streaming_datasets`` instead
+        of stacking every sample into one in-memory array.
+        """
+        from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
+        
+        logger.info("Starting model training...")
+        
+        if streaming:
+            train_ds, test_ds, num_train, num_test, num_features = self.build_streaming_datasets(
+                data_dir, batch_size, workers, cache_dir, seed, shuffle_buffer, augment_noise
+            )
+            fit_data = {'x': train_ds, 'validation_data': test_ds}
+            eval_data = {'x': test_ds}
+        else:
+            # Load data
+            if data_dir and os.path.exists(data_dir):
+                X_real, y_real = self.load_real_data(data_dir, workers=workers, cache_dir=cache_dir)
+                X_synthetic, y_synthetic = self.generate_synthetic_data(50, rng=seed)  # Less synthetic data if we have real data
+                
+                if len(X_real) > 0:
+                    X = np.vstack([X_real, X_synthetic])
+                    y = np.hstack([y_real, y_synthetic])
+                else:
+                    X, y = X_synthetic, y_synthetic
+            else:
+                X, y = self.generate_synthetic_data(200, rng=seed)  # More synthetic data if no real data
+            
+            check_keypoints(X, 'training features')
+            
+            # Encode labels
+            y_encoded = self.label_encoder.transform(y)
+            
+            # Split data
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
+            )
+            num_train, num_test, num_features = X_train.shape[0], X_test.shape[0], X_train.shape[1]
+            fit_data = {'x': X_train, 'y': y_train, 'validation_data': (X_test, y_test), 'batch_size': batch_size}
+            eval_data = {'x': X_test, 'y': y_test}
+        
+        logger.info(f"Training set: {num_train} samples")
+        logger.info(f"Test set: {num_test} samples")
         
         # Create model
-        model = self.create_model(X_train.shape[1])
+        model = self.create_model(num_features)
         
         # Callbacks
         early_stopping = EarlyStopping(
@@ -249,17 +367,17 @@ class YogaPoseTrainer:
         
         # Train model
         history = model.fit(
-            X_train, y_train,
-            validation_data=(X_test, y_test),
+            **fit_data,
             epochs=epochs,
-            batch_size=batch_size,
             callbacks=[early_stopping, reduce_lr],
             verbose=1
         )
         
         # Evaluate model
-        test_loss, test_accuracy = model.evaluate(X_test, y_test, verbose=0)
+        test_loss, test_accuracy = model.evaluate(**eval_data, verbose=0)
         logger.info(f"Test accuracy: {test_accuracy:.4f}")
+        # Kept for export_variants' accuracy gate
+        self.held_out = eval_data
         
         return model, history
     
@@ -279,8 +397,45 @@ class YogaPoseTrainer:
         
         logger.info(f"Labels saved to {labels_path}")
     
+    def held_out_arrays(self):
+        """(features, labels) of the test split from the last train_model call"""
+        if 'y' in self.held_out:
+            return self.held_out['x'], self.held_out['y']
+        batches = list(self.held_out['x'].as_numpy_iterator())
+        return np.concatenate([x for x, _ in batches]), np.concatenate([y for _, y in batches])
+    
+    def export_variants(self, model, model_path='yoga_pose_model.h5', max_accuracy_drop=DEFAULT_MAX_ACCURACY_DROP):
+        """Export float32/float16/int8 NumPy weight packs and an int8 ONNX model next to the saved model
+        
+        Each variant is scored on the held-out split and only written if its
+        top-1 accuracy is within ``max_accuracy_drop`` of the float32 model;
+        the app serves one with PROFIT_MODEL_VARIANT (int8 with integer
+        kernels under PROFIT_INFERENCE_ENGINE=onnx).
+        """
+        features, labels = self.held_out_arrays()
+        report = export_variants(NumpyClassifier.from_keras(model), features, labels, model_path,
+                                 max_accuracy_drop=max_accuracy_drop)
+        logger.info(f"Float32 held-out accuracy: {report['reference_accuracy']:.4f}")
+        return report
+    
+    def export_onnx(self, model, model_path='yoga_pose_model.h5'):
+        """Export the classifier as ``<model>.onnx`` for the ONNX Runtime backend
+        
+        Optional: needs the ``onnx`` package; returns None and logs a warning
+        without it. The app serves it with PROFIT_INFERENCE_ENGINE=onnx.
+        """
+        try:
+            path = export_onnx(NumpyClassifier.from_keras(model), onnx_path(model_path))
+        except ImportError:
+            logger.warning("onnx is not installed; skipping ONNX export")
+            return None
+        logger.info(f"ONNX model saved to {path}")
+        return path
+    
     def plot_training_history(self, history):
         """Plot training history"""
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(12, 4))
         
         plt.subplot(1, 2, 1)
@@ -309,11 +464,19 @@ def main():
     
     # Train the model
     # If you have a dataset, provide the path like: data_dir='path/to/your/yoga_dataset'
+    # and pass workers=os.cpu_count() to extract landmarks in parallel.
+    # streaming=True trains from the keypoint cache through tf.data instead of in-memory arrays
     model, history = trainer.train_model(data_dir=None, epochs=50, batch_size=32)
     
     # Save the model
     trainer.save_model(model)
     
+    # Export reduced-precision weight packs that pass the accuracy gate
+    trainer.export_variants(model)
+    
+    # Export the ONNX graph for ONNX Runtime serving (skipped without the onnx package)
+    trainer.export_onnx(model)
+    
     # Plot training history
     trainer.plot_training_history(history)
     
@@ -321,6 +484,8 @@ def main():
     logger.info("Files generated:")
     logger.info("- yoga_pose_model.h5")
     logger.info("- yoga_pose_model_labels.json")
+    logger.info("- yoga_pose_model.{float32,float16,int8}.npz (those within the accuracy gate)")
+    logger.info("- yoga_pose_model.variants.json")
     logger.info("- training_history.png")
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { Camera, Play, Square, Clock, Award, Info, AlertTriangle } from 'lucide-react';
-import axios from 'axios';
 
 const API_URL = 'http://localhost:5000';
+const STREAM_URL = API_URL.replace(/^http/, 'ws') + '/stream';
+const STREAM_FPS = 12;
+const MAX_BUFFERED_BYTES = 256 * 1024;
 
 export const LiveDetection = () => {
     const videoRef = useRef(null);
@@ -19,29 +21,8 @@ export const LiveDetection = () => {
 
     const timerRef = useRef(null);
     const detectionIntervalRef = useRef(null);
-
-    const yogaApiService = {
-        analyzeImage: (file) => {
-            const formData = new FormData();
-            formData.append('image', file);
-
-            return axios.post(`${API_URL}/predict`, formData, {
-                headers: { 'Content-Type': 'multipart/form-data' },
-                timeout: 10000
-            }).then(res => res.data);
-        }
-    };
-
-    const captureFrame = () => {
-        if (!videoRef.current || !canvasRef.current) return null;
-        const video = videoRef.current;
-        const canvas = canvasRef.current;
-        const ctx = canvas.getContext('2d');
-        canvas.width = video.videoWidth || 640;
-        canvas.height = video.videoHeight || 480;
-        ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-        return canvas.toDataURL('image/jpeg', 0.8);
-    };
+    const socketRef = useRef(null);
+    const captureCanvasRef = useRef(null);
 
     const startStream = async () => {
         try {
@@ -69,6 +50,11 @@ export const LiveDetection = () => {
         }
         clearInterval(timerRef.current);
         clearInterval(detectionIntervalRef.current);
+        if (socketRef.current) {
+            socketRef.current.onclose = null;
+            socketRef.current.close();
+            socketRef.current = null;
+        }
         setIsStreaming(false);
         setDetectedPose(null);
         setFeedback([]);
@@ -78,23 +64,43 @@ export const LiveDetection = () => {
         setError(null);
     };
 
+    const sendFrame = (socket) => {
+        const video = videoRef.current;
+        if (!video || socket.readyState !== WebSocket.OPEN) return;
+        // Skip this tick if the previous frames have not left the send buffer yet
+        if (socket.bufferedAmount > MAX_BUFFERED_BYTES) return;
+        if (!captureCanvasRef.current) captureCanvasRef.current = document.createElement('canvas');
+        const canvas = captureCanvasRef.current;
+        canvas.width = video.videoWidth || 640;
+        canvas.height = video.videoHeight || 480;
+        canvas.getContext('2d').drawImage(video, 0, 0, canvas.width, canvas.height);
+        canvas.toBlob(blob => {
+            if (blob && socket.readyState === WebSocket.OPEN) socket.send(blob);
+        }, 'image/jpeg', 0.7);
+    };
+
     const startLivePoseDetection = () => {
-        detectionIntervalRef.current = setInterval(async () => {
-            if (!isStreaming || isAnalyzing) return;
-            try {
-                setIsAnalyzing(true);
-                const frameData = captureFrame();
-                if (frameData) {
-                    const blob = await fetch(frameData).then(res => res.blob());
-                    const result = await yogaApiService.analyzeImage(blob);
-                    processDetectionResult(result);
-                }
-            } catch (err) {
-                setError("Error analyzing pose. Please check your backend connection.");
-            } finally {
-                setIsAnalyzing(false);
-            }
-        }, 2000);
+        const socket = new WebSocket(STREAM_URL);
+        socket.binaryType = 'arraybuffer';
+        socketRef.current = socket;
+
+        socket.onopen = () => {
+            setIsAnalyzing(true);
+            detectionIntervalRef.current = setInterval(() => sendFrame(socket), 1000 / STREAM_FPS);
+        };
+        socket.onmessage = (event) => {
+            const result = JSON.parse(event.data);
+            // The server only pushes changes of the smoothed pose
+            if (result.predicted_pose) processDetectionResult(result);
+            else if (result.pose_lost) setDetectedPose(null);
+        };
+        socket.onerror = () => {
+            setError("Error analyzing pose. Please check your backend connection.");
+        };
+        socket.onclose = () => {
+            clearInterval(detectionIntervalRef.current);
+            setIsAnalyzing(false);
+        };
     };
 
     const processDetectionResult = (result) => {